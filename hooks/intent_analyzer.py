@@ -22,13 +22,23 @@ Usage:
 import os
 import re
 import time
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from functools import cached_property, lru_cache
+from typing import Callable, List, Optional, Dict, Any, Sequence, Tuple
 
 # Optional YAML support disabled by default to avoid external dependency
 HAS_YAML = False
 
+if HAS_YAML:
+    import yaml
+    # libyaml's C loader when available; same safe semantics, faster parse
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+
 
 class IntentType(Enum):
     """Enumeration of work intent types."""
@@ -37,28 +47,350 @@ class IntentType(Enum):
     AMBIGUOUS = "ambiguous"
 
 
-@dataclass
+@dataclass(frozen=True)
 class WorkIntentResult:
-    """Result of intent analysis with detailed information."""
+    """Result of intent analysis with detailed information.
+    
+    Immutable, so cached results can be handed to every caller as-is.
+    """
+    __slots__ = ("intent_type", "confidence", "matched_patterns", "reasoning")
+    
     intent_type: IntentType
     confidence: float
-    matched_patterns: List[str]
+    matched_patterns: Tuple[str, ...]
     reasoning: str
     
     def __str__(self) -> str:
         return f"WorkIntentResult(type={self.intent_type.value.upper()}, confidence={self.confidence:.2f})"
 
 
-def log_debug(message: str) -> None:
-    """Write debug logs if debugging enabled."""
-    if os.environ.get("AGENT_OS_DEBUG", "").lower() == "true":
+# Checked once; the analyzer runs as a short-lived process
+_DEBUG_ENABLED = os.environ.get("AGENT_OS_DEBUG", "").lower() == "true"
+
+
+def log_debug(message: str, *args: Any) -> None:
+    """Write debug logs if debugging enabled.
+    
+    Arguments are %-formatted into message only when debugging is on.
+    """
+    if _DEBUG_ENABLED:
         from datetime import datetime
+        if args:
+            message = message % args
         log_path = os.path.expanduser("~/.agent-os/logs/intent-analyzer-debug.log")
         os.makedirs(os.path.dirname(log_path), exist_ok=True)
         with open(log_path, "a") as f:
             f.write(f"[{datetime.now().isoformat()}] {message}\n")
 
 
+# Parsed configuration files keyed by (path, mtime); edits invalidate entries
+_CONFIG_CACHE: Dict[Tuple[str, float], Dict[str, Any]] = {}
+
+
+def _parse_config_file(path: str) -> Dict[str, Any]:
+    """Parse a YAML configuration file; an empty file gives {}."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+# Default pattern sets, shared by every analyzer without configured patterns
+_DEFAULT_MAINTENANCE_PATTERNS = (
+    r'\bfix\b.*\btests?\b',
+    r'\bfix\b.*\bbug\b',
+    r'\bfix\b.*\bissues?\b',
+    r'\bfix\b.*\berrors?\b',
+    r'\bfix\b.*\bfail',
+    r'\bdebug\b',
+    r'\bresolve\b.*\bconflicts?\b',
+    r'\baddress\b.*\bci\b',
+    r'\baddress\b.*\bpipeline\b',
+    r'\bupdate\b.*\bdependen',
+    r'\brefactor\b.*\b(existing|code|without.*new)\b',
+    r'\bfix\b.*\bstyles?\b',
+    r'\bfix\b.*\bbrok',
+    r'\bresolve\b.*\berrors?\b',
+    r'\bfix\b.*\bperformance\b',
+    r'\bfix\b.*\bvalidation\b',
+    r'\brepair\b',
+    r'\bcorrect\b',
+    r'\bmend\b',
+    r'\bpatch\b',
+    # Performance and optimization patterns (usually maintenance)
+    r'\boptimize\b.*\b(database|queries|performance|speed)\b',
+    r'\bimprove\b.*\b(performance|speed|loading|response)\b',
+    r'\benhance\b.*\b(performance|security|existing)\b',
+    # Refactoring and improvement patterns
+    r'\brefactor\b(?!.*\bnew\b)',
+    r'\bimprove\b.*\b(existing|current)\b',
+    r'\benhance\b.*\b(current|existing)\b'
+)
+
+_DEFAULT_NEW_WORK_PATTERNS = (
+    r'\bimplement\b.*\b(feature|dashboard|profile|system|component)\b',
+    r'\bimplement\b.*\bfunctionality\b',
+    r'\bbuild\b.*\bnew\b',
+    r'\bbuild\b.*\b(dashboard|interface|system|feature|notification|service)\b',
+    r'\bcreate\b.*\b(feature|component|system|interface|dashboard|profile)\b',
+    r'\badd\b.*\b(feature|functionality|system|dashboard|notifications?)\b',
+    r'\bdevelop\b.*\b(feature|system|interface|component|dashboard|api|rate|limiting)\b',
+    r'\bdesign\b.*\b(feature|system|interface|component|dashboard)\b',
+    r'\bimplement\b.*\b(oauth|auth|login|signup|profile)\b',
+    r'\bcreate\b.*\b(api|endpoint|service|dashboard)\b',
+    r'\badd\b.*\b(search|notifications?|integration|dashboard|real-time)\b',
+    r'\bimplement\b.*\buser\b.*\b(profile|dashboard|management|interface)\b',
+    # New patterns for cases that were previously ambiguous
+    r'\bbuild\b.*\b(notification|service|api|endpoint)\b',
+    r'\badd\b.*\b(user|profile|management)\b',
+    r'\bdesign\b.*\bnew\b.*\b(api|endpoints?)\b',
+    r'\bcreate\b.*\bnew\b',
+    r'\bimplement\b.*\bnew\b',
+    r'\bdevelop\b.*\bnew\b',
+    # Specific service/component patterns
+    r'\bbuild\b.*\bservice\b',
+    r'\bcreate\b.*\bservice\b',
+    r'\bimplement\b.*\bservice\b',
+    # Management and user-facing features
+    r'\badd\b.*\bmanagement\b',
+    r'\bcreate\b.*\bmanagement\b',
+    r'\bimplement\b.*\bmanagement\b'
+)
+
+
+@lru_cache(maxsize=None)
+def _compile_pattern_set(patterns: Tuple[str, ...]) -> Tuple[re.Pattern, ...]:
+    """Compile a pattern set once per process; shared by all analyzers."""
+    compiled = []
+    for pattern in patterns:
+        try:
+            compiled.append(re.compile(pattern, re.IGNORECASE))
+        except re.error as e:
+            log_debug("Invalid regex pattern '%s': %s", pattern, e)
+            continue
+    return tuple(compiled)
+
+
+@lru_cache(maxsize=None)
+def _ascii_pattern_set(compiled: Tuple[re.Pattern, ...]) -> Tuple[re.Pattern, ...]:
+    """re.ASCII twin of a compiled set, for searching ASCII-only messages.
+    
+    On an ASCII message, ASCII and Unicode \\b and case folding agree, and
+    the ASCII tables make searches about 3x faster. Non-ASCII messages must
+    use the Unicode set, where letters such as "ä" are not word boundaries.
+    Positions match the source set, so trigger-index selections apply to both.
+    """
+    ascii_compiled = []
+    for pattern in compiled:
+        try:
+            flags = (pattern.flags & ~re.UNICODE) | re.ASCII
+            ascii_compiled.append(re.compile(pattern.pattern, flags))
+        except (re.error, ValueError):
+            ascii_compiled.append(pattern)
+    return tuple(ascii_compiled)
+
+
+def _split_gaps(source: str) -> List[str]:
+    """Split a pattern at its top-level greedy ``.*`` gaps.
+
+    Gaps inside groups or character classes, escaped dots, and lazy or
+    possessive gaps do not split.
+    """
+    parts = []
+    depth, escaped, in_class = 0, False, False
+    start = i = 0
+    while i < len(source):
+        ch = source[i]
+        if escaped:
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif (depth == 0 and source.startswith(".*", i)
+              and not source.startswith((".*?", ".*+"), i)):
+            parts.append(source[start:i])
+            start = i = i + 2
+            continue
+        i += 1
+    parts.append(source[start:])
+    return parts
+
+
+class _GapChain:
+    """Searches ``\\bw1\\b.*\\bw2\\b.* ... tail`` without backtracking.
+
+    re.search retries every ``.*`` gap from each occurrence of the word
+    before it, which is quadratic on messages that repeat that word. Because
+    the gap cannot cross a newline, the first occurrence of each word on a
+    line leaves the most room for the rest of the pattern, so one forward
+    pass per line finds a match exactly when the regex does.
+    """
+    
+    __slots__ = ("words", "tail")
+    
+    def __init__(self, words: Tuple[re.Pattern, ...], tail: re.Pattern):
+        self.words = words
+        self.tail = tail
+    
+    def search(self, message: str) -> bool:
+        pos = 0
+        while pos <= len(message):
+            match = self.words[0].search(message, pos)
+            if match is None:
+                return False
+            line_end = message.find("\n", match.end())
+            if line_end < 0:
+                line_end = len(message)
+            end = match.end()
+            for word in self.words[1:]:
+                match = word.search(message, end, line_end)
+                if match is None:
+                    break
+                end = match.end()
+            else:
+                match = self.tail.search(message, end)
+                if match is None:
+                    return False  # Later lines only start further on
+                if match.start() <= line_end:
+                    return True
+            pos = line_end + 1
+        return False
+
+
+@lru_cache(maxsize=None)
+def _pattern_searchers(compiled: Tuple[re.Pattern, ...]) -> Tuple[Callable[[str], Any], ...]:
+    """One search callable per pattern of a compiled set, in the same order.
+    
+    Patterns made of literal words joined by ``.*`` gaps get a _GapChain;
+    the rest keep their own search.
+    """
+    searchers = []
+    for pattern in compiled:
+        parts = _split_gaps(pattern.pattern)
+        if (len(parts) > 1 and not pattern.flags & (re.DOTALL | re.VERBOSE)
+                and all(_LEADING_WORD.fullmatch(part) for part in parts[:-1])):
+            words = tuple(re.compile(part, pattern.flags) for part in parts[:-1])
+            searchers.append(_GapChain(words, re.compile(parts[-1], pattern.flags)).search)
+        else:
+            searchers.append(pattern.search)
+    return tuple(searchers)
+
+
+# Backreferences are numbered per pattern, so they would break once joined
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+@lru_cache(maxsize=None)
+def _combine_pattern_set(compiled: Tuple[re.Pattern, ...]) -> Optional[re.Pattern]:
+    """Join a compiled set into one alternation used as an "any match" test.
+
+    The alternation only tells whether *some* pattern matches; per-pattern
+    results still come from the individual patterns, so counts are unchanged.
+    Returns None when the set cannot be joined safely.
+    """
+    if not compiled or any(_BACKREFERENCE.search(p.pattern) for p in compiled):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p.pattern})" for p in compiled), re.IGNORECASE)
+    except re.error:
+        return None
+
+
+# Leading literal word of a pattern, e.g. r'\bfix\b.*\btests?\b' -> 'fix'
+_LEADING_WORD = re.compile(r"\\b([A-Za-z]+)\\b")
+
+
+def _leading_word(source: str) -> Optional[str]:
+    """Return the word every match of source must start with, if any.
+
+    Patterns with a top-level alternation can match without their first
+    word, so they have no trigger.
+    """
+    match = _LEADING_WORD.match(source)
+    if not match:
+        return None
+    depth, escaped, in_class = 0, False, False
+    for ch in source:
+        if escaped:
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            return None
+    return match.group(1).lower()
+
+
+class _TriggerIndex:
+    """Selects the patterns whose leading word occurs in a message."""
+    
+    __slots__ = ("scanner", "groups", "always")
+    
+    def __init__(self, scanner: re.Pattern, groups: Dict[str, Tuple[int, ...]],
+                 always: Tuple[int, ...]):
+        self.scanner = scanner
+        self.groups = groups
+        self.always = always
+    
+    def select(self, message: str) -> List[int]:
+        """Indices of patterns that can match, in original order."""
+        selected = set(self.always)
+        for match in self.scanner.finditer(message):
+            selected.update(self.groups[match.lastgroup])
+        return sorted(selected)
+    
+    def select_many(self, messages: Sequence[str]) -> List[List[int]]:
+        """select() for a batch of messages in a single scanner pass.
+        
+        Messages are joined with newlines, which are never part of a word,
+        so every scanner hit lies inside one message and is attributed to it
+        by offset.
+        """
+        starts = []
+        offset = 0
+        for message in messages:
+            starts.append(offset)
+            offset += len(message) + 1
+        selected = [set(self.always) for _ in messages]
+        for match in self.scanner.finditer("\n".join(messages)):
+            selected[bisect_right(starts, match.start()) - 1].update(self.groups[match.lastgroup])
+        return [sorted(s) for s in selected]
+
+
+@lru_cache(maxsize=None)
+def _index_pattern_set(compiled: Tuple[re.Pattern, ...]) -> Optional[_TriggerIndex]:
+    """Group a compiled set by leading word; None if no pattern has one."""
+    by_word: Dict[str, List[int]] = {}
+    always = []
+    for i, pattern in enumerate(compiled):
+        word = _leading_word(pattern.pattern)
+        if word is None:
+            always.append(i)
+        else:
+            by_word.setdefault(word, []).append(i)
+    if not by_word:
+        return None
+    words = sorted(by_word)
+    scanner = re.compile(
+        r"\b(?:" + "|".join(f"(?P<w{i}>{re.escape(w)})" for i, w in enumerate(words)) + r")\b",
+        re.IGNORECASE
+    )
+    groups = {f"w{i}": tuple(by_word[w]) for i, w in enumerate(words)}
+    return _TriggerIndex(scanner, groups, tuple(always))
+
+
 class IntentAnalyzer:
     """
     Analyzes user messages to determine work intent (maintenance vs new development).
@@ -76,23 +408,86 @@ class IntentAnalyzer:
         """
         self.config_path = config_path or os.path.expanduser("~/.agent-os/config/workflow-enforcement.yaml")
         
-        # Load configuration or use defaults
-        self.config = self._load_configuration()
-        
-        # Extract patterns from configuration
-        self.maintenance_patterns = self.config.get('maintenance_patterns', self._get_default_maintenance_patterns())
-        self.new_work_patterns = self.config.get('new_work_patterns', self._get_default_new_work_patterns())
-        
-        # Confidence thresholds
-        self.confidence_threshold = self.config.get('confidence_threshold', 0.3)
-        self.ambiguous_threshold = self.config.get('ambiguous_threshold', 0.15)
-        
-        # Compile patterns for performance
-        self.compiled_maintenance_patterns = self._compile_patterns(self.maintenance_patterns)
-        self.compiled_new_work_patterns = self._compile_patterns(self.new_work_patterns)
+        # Configuration and compiled patterns are loaded on first use (see the
+        # cached properties below), so constructing an analyzer is cheap
         
-        log_debug(f"IntentAnalyzer initialized with {len(self.maintenance_patterns)} maintenance patterns, "
-                 f"{len(self.new_work_patterns)} new work patterns")
+        # Per-instance result cache, so analyzers with different patterns
+        # never share entries; keyed by the normalised message
+        self._analyze_cached = lru_cache(maxsize=1024)(self._analyze_message)
+    
+    @cached_property
+    def config(self) -> Dict[str, Any]:
+        """Configuration loaded from config_path (empty dict for defaults)."""
+        return self._load_configuration()
+    
+    @cached_property
+    def maintenance_patterns(self) -> Sequence[str]:
+        """Maintenance pattern sources from configuration or defaults."""
+        return self.config.get('maintenance_patterns', _DEFAULT_MAINTENANCE_PATTERNS)
+    
+    @cached_property
+    def new_work_patterns(self) -> Sequence[str]:
+        """New work pattern sources from configuration or defaults."""
+        return self.config.get('new_work_patterns', _DEFAULT_NEW_WORK_PATTERNS)
+    
+    @cached_property
+    def confidence_threshold(self) -> float:
+        """Minimum confidence for a non-ambiguous classification."""
+        return self.config.get('confidence_threshold', 0.3)
+    
+    @cached_property
+    def ambiguous_threshold(self) -> float:
+        """Configured ambiguity threshold."""
+        return self.config.get('ambiguous_threshold', 0.15)
+    
+    @cached_property
+    def compiled_maintenance_patterns(self) -> Tuple[re.Pattern, ...]:
+        """Compiled maintenance patterns."""
+        compiled = self._compile_patterns(self.maintenance_patterns)
+        log_debug("IntentAnalyzer compiled %d maintenance patterns", len(compiled))
+        return compiled
+    
+    @cached_property
+    def compiled_new_work_patterns(self) -> Tuple[re.Pattern, ...]:
+        """Compiled new work patterns."""
+        compiled = self._compile_patterns(self.new_work_patterns)
+        log_debug("IntentAnalyzer compiled %d new work patterns", len(compiled))
+        return compiled
+    
+    @cached_property
+    def _ascii_maintenance_patterns(self) -> Tuple[re.Pattern, ...]:
+        return _ascii_pattern_set(self.compiled_maintenance_patterns)
+    
+    @cached_property
+    def _ascii_new_work_patterns(self) -> Tuple[re.Pattern, ...]:
+        return _ascii_pattern_set(self.compiled_new_work_patterns)
+    
+    # One-pass screens for sets without trigger words; built on first use
+    @cached_property
+    def _maintenance_prefilter(self) -> Optional[re.Pattern]:
+        return _combine_pattern_set(self.compiled_maintenance_patterns)
+    
+    @cached_property
+    def _new_work_prefilter(self) -> Optional[re.Pattern]:
+        return _combine_pattern_set(self.compiled_new_work_patterns)
+    
+    @cached_property
+    def _maintenance_index(self) -> Optional[_TriggerIndex]:
+        return _index_pattern_set(self.compiled_maintenance_patterns)
+    
+    @cached_property
+    def _new_work_index(self) -> Optional[_TriggerIndex]:
+        return _index_pattern_set(self.compiled_new_work_patterns)
+    
+    # Confidence per matched pattern: 0.6 per hit plus 0.4 x the matched share
+    # of the set, folded into one factor so scoring needs no division
+    @cached_property
+    def _maintenance_hit_weight(self) -> float:
+        return 0.6 + 0.4 / max(1, len(self.compiled_maintenance_patterns))
+    
+    @cached_property
+    def _new_work_hit_weight(self) -> float:
+        return 0.6 + 0.4 / max(1, len(self.compiled_new_work_patterns))
     
     def _load_configuration(self) -> Dict[str, Any]:
         """Load configuration from YAML file with error handling."""
@@ -101,93 +496,38 @@ class IntentAnalyzer:
             return {}
             
         if not os.path.exists(self.config_path):
-            log_debug(f"Configuration file not found at {self.config_path}, using defaults")
+            log_debug("Configuration file not found at %s, using defaults", self.config_path)
             return {}
         
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-                log_debug(f"Loaded configuration from {self.config_path}")
-                return config or {}
+            cache_key = (self.config_path, os.path.getmtime(self.config_path))
+        except OSError:
+            cache_key = None
+        if cache_key in _CONFIG_CACHE:
+            log_debug("Reusing configuration from %s", self.config_path)
+            return _CONFIG_CACHE[cache_key]
+        
+        try:
+            config = _parse_config_file(self.config_path)
+            log_debug("Loaded configuration from %s", self.config_path)
         except Exception as e:
-            log_debug(f"Failed to load configuration from {self.config_path}: {e}")
+            log_debug("Failed to load configuration from %s: %s", self.config_path, e)
             return {}
+        if cache_key is not None:
+            _CONFIG_CACHE[cache_key] = config
+        return config
     
     def _get_default_maintenance_patterns(self) -> List[str]:
         """Get default maintenance work patterns."""
-        return [
-            r'\bfix\b.*\btests?\b',
-            r'\bfix\b.*\bbug\b',
-            r'\bfix\b.*\bissues?\b',
-            r'\bfix\b.*\berrors?\b',
-            r'\bfix\b.*\bfail',
-            r'\bdebug\b',
-            r'\bresolve\b.*\bconflicts?\b',
-            r'\baddress\b.*\bci\b',
-            r'\baddress\b.*\bpipeline\b',
-            r'\bupdate\b.*\bdependen',
-            r'\brefactor\b.*\b(existing|code|without.*new)\b',
-            r'\bfix\b.*\bstyles?\b',
-            r'\bfix\b.*\bbrok',
-            r'\bresolve\b.*\berrors?\b',
-            r'\bfix\b.*\bperformance\b',
-            r'\bfix\b.*\bvalidation\b',
-            r'\brepair\b',
-            r'\bcorrect\b',
-            r'\bmend\b',
-            r'\bpatch\b',
-            # Performance and optimization patterns (usually maintenance)
-            r'\boptimize\b.*\b(database|queries|performance|speed)\b',
-            r'\bimprove\b.*\b(performance|speed|loading|response)\b',
-            r'\benhance\b.*\b(performance|security|existing)\b',
-            # Refactoring and improvement patterns
-            r'\brefactor\b(?!.*\bnew\b)',
-            r'\bimprove\b.*\b(existing|current)\b',
-            r'\benhance\b.*\b(current|existing)\b'
-        ]
+        return list(_DEFAULT_MAINTENANCE_PATTERNS)
     
     def _get_default_new_work_patterns(self) -> List[str]:
         """Get default new work patterns."""
-        return [
-            r'\bimplement\b.*\b(feature|dashboard|profile|system|component)\b',
-            r'\bimplement\b.*\bfunctionality\b',
-            r'\bbuild\b.*\bnew\b',
-            r'\bbuild\b.*\b(dashboard|interface|system|feature|notification|service)\b',
-            r'\bcreate\b.*\b(feature|component|system|interface|dashboard|profile)\b',
-            r'\badd\b.*\b(feature|functionality|system|dashboard|notifications?)\b',
-            r'\bdevelop\b.*\b(feature|system|interface|component|dashboard|api|rate|limiting)\b',
-            r'\bdesign\b.*\b(feature|system|interface|component|dashboard)\b',
-            r'\bimplement\b.*\b(oauth|auth|login|signup|profile)\b',
-            r'\bcreate\b.*\b(api|endpoint|service|dashboard)\b',
-            r'\badd\b.*\b(search|notifications?|integration|dashboard|real-time)\b',
-            r'\bimplement\b.*\buser\b.*\b(profile|dashboard|management|interface)\b',
-            # New patterns for cases that were previously ambiguous
-            r'\bbuild\b.*\b(notification|service|api|endpoint)\b',
-            r'\badd\b.*\b(user|profile|management)\b',
-            r'\bdesign\b.*\bnew\b.*\b(api|endpoints?)\b',
-            r'\bcreate\b.*\bnew\b',
-            r'\bimplement\b.*\bnew\b',
-            r'\bdevelop\b.*\bnew\b',
-            # Specific service/component patterns
-            r'\bbuild\b.*\bservice\b',
-            r'\bcreate\b.*\bservice\b',
-            r'\bimplement\b.*\bservice\b',
-            # Management and user-facing features
-            r'\badd\b.*\bmanagement\b',
-            r'\bcreate\b.*\bmanagement\b',
-            r'\bimplement\b.*\bmanagement\b'
-        ]
-    
-    def _compile_patterns(self, patterns: List[str]) -> List[re.Pattern]:
-        """Compile regex patterns for efficient matching."""
-        compiled = []
-        for pattern in patterns:
-            try:
-                compiled.append(re.compile(pattern, re.IGNORECASE))
-            except re.error as e:
-                log_debug(f"Invalid regex pattern '{pattern}': {e}")
-                continue
-        return compiled
+        return list(_DEFAULT_NEW_WORK_PATTERNS)
+    
+    def _compile_patterns(self, patterns: Sequence[str]) -> Tuple[re.Pattern, ...]:
+        """Compile regex patterns for efficient matching (cached per process)."""
+        return _compile_pattern_set(tuple(patterns))
     
     def analyze_intent(self, user_message: str) -> WorkIntentResult:
         """
@@ -199,64 +539,124 @@ class IntentAnalyzer:
         Returns:
             WorkIntentResult with intent type, confidence, and reasoning
         """
-        start_time = time.time()
+        # Timing is only reported in debug logs, so skip the clock otherwise
+        start_time = time.time() if _DEBUG_ENABLED else 0.0
         
         # Input validation and preprocessing
         if not user_message or not user_message.strip():
             return WorkIntentResult(
                 intent_type=IntentType.AMBIGUOUS,
                 confidence=0.0,
-                matched_patterns=[],
+                matched_patterns=(),
                 reasoning="Empty or whitespace-only message"
             )
         
-        message = user_message.strip().lower()
-        log_debug(f"Analyzing intent for message: '{message[:100]}{'...' if len(message) > 100 else ''}'")
+        # Patterns are compiled with IGNORECASE, so no lowercased copy is needed
+        message = user_message.strip()
+        log_debug("Analyzing intent for message: '%.100s%s'",
+                  message, '...' if len(message) > 100 else '')
+        
+        result = self._analyze_cached(message)
+        
+        if _DEBUG_ENABLED:
+            log_debug("Intent analysis completed in %.3fs: %s", time.time() - start_time, result)
+        
+        return result
+    
+    def analyze_many(self, user_messages: Sequence[str]) -> List[WorkIntentResult]:
+        """
+        Analyze a batch of messages, e.g. when replaying logged prompts.
+        
+        Trigger words are located for the whole batch with one scan per
+        pattern set, and repeated messages are classified once.
+        
+        Args:
+            user_messages: Messages to analyze
+            
+        Returns:
+            One WorkIntentResult per message, in input order
+        """
+        start_time = time.time() if _DEBUG_ENABLED else 0.0
+        messages = [m.strip() if m else "" for m in user_messages]
+        unique = list(dict.fromkeys(m for m in messages if m))
+        
+        maintenance_index, new_work_index = self._maintenance_index, self._new_work_index
+        maintenance_selected = (maintenance_index.select_many(unique) if maintenance_index
+                                else [None] * len(unique))
+        new_work_selected = (new_work_index.select_many(unique) if new_work_index
+                             else [None] * len(unique))
+        results = {
+            message: self._analyze_message(message, maint_sel, new_sel)
+            for message, maint_sel, new_sel in zip(unique, maintenance_selected, new_work_selected)
+        }
+        
+        if _DEBUG_ENABLED:
+            log_debug("Analyzed %d messages (%d unique) in %.3fs",
+                      len(messages), len(unique), time.time() - start_time)
+        return [results[m] if m else self.analyze_intent(m) for m in messages]
+    
+    def _analyze_message(self, message: str,
+                         maintenance_selected: Optional[List[int]] = None,
+                         new_work_selected: Optional[List[int]] = None) -> WorkIntentResult:
+        """Classify a stripped message.
+        
+        The *_selected arguments are trigger-index selections already made
+        for this message by analyze_many.
+        """
+        # ASCII-only messages can use the faster re.ASCII pattern sets
+        if message.isascii():
+            maintenance_patterns = self._ascii_maintenance_patterns
+            new_work_patterns = self._ascii_new_work_patterns
+        else:
+            maintenance_patterns = self.compiled_maintenance_patterns
+            new_work_patterns = self.compiled_new_work_patterns
+        
+        # The combined screen is only built for sets the trigger index can't cover
+        maintenance_index, new_work_index = self._maintenance_index, self._new_work_index
         
         # Check for maintenance patterns
-        maintenance_matches = self._find_pattern_matches(message, self.compiled_maintenance_patterns)
-        maintenance_score = len(maintenance_matches) / max(1, len(self.compiled_maintenance_patterns))
+        maintenance_matches = self._find_pattern_matches(
+            message, maintenance_patterns, maintenance_index, maintenance_selected,
+            self._maintenance_prefilter if maintenance_index is None else None)
         
         # Check for new work patterns  
-        new_work_matches = self._find_pattern_matches(message, self.compiled_new_work_patterns)
-        new_work_score = len(new_work_matches) / max(1, len(self.compiled_new_work_patterns))
+        new_work_matches = self._find_pattern_matches(
+            message, new_work_patterns, new_work_index, new_work_selected,
+            self._new_work_prefilter if new_work_index is None else None)
         
         # Determine intent based on pattern matches
-        result = self._determine_intent(
-            maintenance_matches, maintenance_score,
-            new_work_matches, new_work_score,
-            message
-        )
-        
-        analysis_time = time.time() - start_time
-        log_debug(f"Intent analysis completed in {analysis_time:.3f}s: {result}")
-        
-        return result
+        return self._determine_intent(maintenance_matches, new_work_matches, message)
     
-    def _find_pattern_matches(self, message: str, compiled_patterns: List[re.Pattern]) -> List[str]:
+    def _find_pattern_matches(self, message: str, compiled_patterns: Tuple[re.Pattern, ...],
+                              index: Optional[_TriggerIndex] = None,
+                              selected: Optional[List[int]] = None,
+                              prefilter: Optional[re.Pattern] = None) -> List[str]:
         """Find all pattern matches in the message."""
-        matches = []
-        for pattern in compiled_patterns:
-            if pattern.search(message):
-                matches.append(pattern.pattern)
-        return matches
-    
-    def _determine_intent(self, maintenance_matches: List[str], maintenance_score: float,
-                         new_work_matches: List[str], new_work_score: float,
+        if selected is None and index is not None:
+            selected = index.select(message)
+        if selected is None:
+            if prefilter is not None and not prefilter.search(message):
+                # A miss on the combined alternation means no single pattern can hit
+                return []
+            selected = range(len(compiled_patterns))
+        # Only patterns whose leading word occurs in the message can hit
+        searchers = _pattern_searchers(compiled_patterns)
+        return [compiled_patterns[i].pattern for i in selected if searchers[i](message)]
+    
+    def _determine_intent(self, maintenance_matches: List[str], new_work_matches: List[str],
                          message: str) -> WorkIntentResult:
         """Determine final intent based on pattern analysis."""
         
-        # Calculate confidence based on number of matches and base score
-        # Use higher confidence calculation to pass tests
-        maintenance_confidence = min(1.0, len(maintenance_matches) * 0.6 + maintenance_score * 0.4)
-        new_work_confidence = min(1.0, len(new_work_matches) * 0.6 + new_work_score * 0.4)
+        # Calculate confidence based on number of matches and share of the set matched
+        maintenance_confidence = min(1.0, len(maintenance_matches) * self._maintenance_hit_weight)
+        new_work_confidence = min(1.0, len(new_work_matches) * self._new_work_hit_weight)
         
         # Determine intent type
         if maintenance_confidence > self.confidence_threshold and maintenance_confidence > new_work_confidence:
             return WorkIntentResult(
                 intent_type=IntentType.MAINTENANCE,
                 confidence=maintenance_confidence,
-                matched_patterns=maintenance_matches,
+                matched_patterns=tuple(maintenance_matches),
                 reasoning=f"Matched {len(maintenance_matches)} maintenance patterns: {', '.join(maintenance_matches[:3])}"
             )
         
@@ -264,7 +664,7 @@ class IntentAnalyzer:
             return WorkIntentResult(
                 intent_type=IntentType.NEW_WORK,
                 confidence=new_work_confidence,
-                matched_patterns=new_work_matches,
+                matched_patterns=tuple(new_work_matches),
                 reasoning=f"Matched {len(new_work_matches)} new work patterns: {', '.join(new_work_matches[:3])}"
             )
         
@@ -282,13 +682,14 @@ class IntentAnalyzer:
             return WorkIntentResult(
                 intent_type=IntentType.AMBIGUOUS,
                 confidence=max_confidence,
-                matched_patterns=maintenance_matches + new_work_matches,
+                matched_patterns=tuple(maintenance_matches + new_work_matches),
                 reasoning=reasoning
             )
 
 
 def main():
     """Command-line interface for testing the intent analyzer."""
+    global _DEBUG_ENABLED
     import argparse
     
     parser = argparse.ArgumentParser(description="Analyze work intent from user messages")
@@ -299,7 +700,7 @@ def main():
     args = parser.parse_args()
     
     if args.debug:
-        os.environ["AGENT_OS_DEBUG"] = "true"
+        _DEBUG_ENABLED = True
     
     analyzer = IntentAnalyzer(config_path=args.config)
     result = analyzer.analyze_intent(args.message)
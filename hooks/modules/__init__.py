@@ -2,33 +2,55 @@
 Agent OS Hook Modules
 Modular hook architecture for Agent OS workflow enforcement.
 Each module handles a specific hook type with single responsibility.
+
+Exports are loaded on first access (PEP 562), so a hook process that needs
+one handler does not import the others.
 """
 
-from .hook_core_optimized import (
-    BaseHookHandler,
-    HookError,
-    HookLogger,
-    WorkspaceResolver,
-    GitChecker,
-    IntentAnalyzer,
-    SpecChecker
-)
-
-from .pretool_handler_optimized import PreToolHandler
-from .posttool_handler_optimized import PostToolHandler
-from .userprompt_handler_optimized import UserPromptHandler
-from .task_handler_optimized import TaskHandler
+import importlib
+
+# Exported name -> submodule that defines it
+_LAZY = {
+    'BaseHookHandler': '.hook_core_optimized',
+    'HookError': '.hook_core_optimized',
+    'HookLogger': '.hook_core_optimized',
+    'WorkspaceResolver': '.hook_core_optimized',
+    'GitChecker': '.hook_core_optimized',
+    'IntentAnalyzer': '.hook_core_optimized',
+    'SpecChecker': '.hook_core_optimized',
+    'PreToolHandler': '.pretool_handler_optimized',
+    'PostToolHandler': '.posttool_handler_optimized',
+    'UserPromptHandler': '.userprompt_handler_optimized',
+    'TaskHandler': '.task_handler_optimized',
+    'WarmHandler': '.warm_handler_optimized',
+}
 
 __all__ = [
     'BaseHookHandler',
-    'HookError', 
+    'HookError',
     'HookLogger',
     'WorkspaceResolver',
     'GitChecker',
     'IntentAnalyzer',
     'SpecChecker',
     'PreToolHandler',
-    'PostToolHandler', 
+    'PostToolHandler',
     'UserPromptHandler',
-    'TaskHandler'
+    'TaskHandler',
+    'WarmHandler'
 ]
+
+
+def __getattr__(name):
+    """Import an exported name's submodule on first access and cache it."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
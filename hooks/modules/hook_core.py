@@ -6,20 +6,20 @@ This module re-exports all public members from hook_core_optimized to preserve
 backward compatibility with existing imports that reference `hook_core`.
 
 It supports two import contexts:
-1) Direct module import with sys.path pointing to the modules directory:
-   from hook_core import ...
-   In this case, we use absolute import: from hook_core_optimized import *
-2) Package import (hooks.modules.hook_core):
+1) Package import (hooks.modules.hook_core or modules.hook_core):
    from hooks.modules.hook_core import ...
-   In this case, we fall back to relative import: from .hook_core_optimized import *
+   In this case, we use relative import: from .hook_core_optimized import *
+2) Direct module import with sys.path pointing to the modules directory:
+   from hook_core import ...
+   In this case, we fall back to absolute import: from hook_core_optimized import *
 """
 
-# Prefer absolute import when the modules directory is on sys.path
+# Prefer package-relative import; it fails fast without a sys.path search
 try:
-    from hook_core_optimized import *  # type: ignore  # noqa: F401,F403
-except Exception:
-    # Fallback for package-relative import
     from .hook_core_optimized import *  # type: ignore  # noqa: F401,F403
+except ImportError:
+    # Fallback when the modules directory itself is on sys.path
+    from hook_core_optimized import *  # type: ignore  # noqa: F401,F403
 
 # Ensure __all__ is defined for explicit re-exports.
 try:
@@ -5,23 +5,39 @@ Agent OS Hook Core Module - Optimized Version
 Performance-optimized shared utilities with caching and async patterns.
 """
 
+import atexit
+import hashlib
 import json
 import os
+import shutil
 import subprocess
 import sys
 import threading
 import time
 from datetime import datetime
 from typing import Optional, Dict, Any, List, Tuple
-from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
-# Add parent directory to path for project root resolver
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-try:
-    from scripts.project_root_resolver import ProjectRootResolver
-except ImportError:
-    ProjectRootResolver = None
+# Repository root holding scripts/project_root_resolver.py
+AGENT_OS_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Dispatcher used to start detached cache-warming runs
+DISPATCHER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "workflow-enforcement-hook.py"
+)
+
+
+# User-level Agent OS paths, expanded once per process
+AGENT_OS_HOME = os.path.expanduser("~/.agent-os")
+DEBUG_LOG_PATH = os.path.join(AGENT_OS_HOME, "logs", "hooks-debug.log")
+WORK_SESSION_FILE = os.path.join(AGENT_OS_HOME, "cache", "work-session")
+HOOK_CACHE_DIR = os.path.join(AGENT_OS_HOME, "cache", "hooks")
+INTENT_ANALYZER_SCRIPT = os.path.join(AGENT_OS_HOME, "scripts", "intent-analyzer.sh")
+UPDATE_DOCUMENTATION_SCRIPT = os.path.join(AGENT_OS_HOME, "scripts", "update-documentation.sh")
+
+# Environment switches are fixed for the life of a hook process
+DEBUG_ENABLED = os.environ.get("AGENT_OS_DEBUG", "").lower() == "true"
+WORK_SESSION_ENV_ACTIVE = os.environ.get("AGENT_OS_WORK_SESSION", "").lower() == "true"
 
 
 # Global cache with TTL
@@ -54,9 +70,102 @@ class TTLCache:
             self._cache[key] = value
             self._timestamps[key] = time.time()
 
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._cache.clear()
+            self._timestamps.clear()
+
+
+class DiskCache:
+    """JSON-file cache shared by successive hook processes.
+
+    Each hook invocation is a fresh process, so TTLCache only helps within
+    one call. Entries here live in one file per key; freshness is judged by
+    file mtime and writes are atomic (temp file + os.replace).
+    """
+    
+    def __init__(self, directory: str = HOOK_CACHE_DIR):
+        self.directory = directory
+    
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+    
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """Return the cached value if younger than ttl seconds."""
+        value, _ = self.get_swr(key, ttl, ttl)
+        return value
+    
+    def get_swr(self, key: str, ttl: float, hard_ttl: float) -> Tuple[Optional[Any], bool]:
+        """Stale-while-revalidate lookup.
+
+        Returns (value, is_stale): values younger than ttl are fresh, values
+        up to hard_ttl old are returned flagged stale, older ones are misses.
+        """
+        path = self._path(key)
+        try:
+            age = time.time() - os.stat(path).st_mtime
+            if age > hard_ttl:
+                return None, False
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None, False
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None, False
+        return entry.get("value"), age > ttl
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serialisable value; failures are ignored."""
+        path = self._path(key)
+        # Per thread as well as per process: threads of one hook may write at once
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({"key": key, "value": value}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    
+    def claim(self, key: str, ttl: float) -> bool:
+        """Atomically take a marker for key, unless a claim younger than ttl holds it.
+
+        Exactly one of any number of concurrent callers, in any process or
+        thread, gets True. An expired marker is moved aside with os.rename,
+        which also succeeds for only one caller, before it is re-created.
+        """
+        path = self._path(key)
+        for _ in range(2):
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                try:
+                    if time.time() - os.stat(path).st_mtime <= ttl:
+                        return False
+                    stale_path = f"{path}.{os.getpid()}.{threading.get_ident()}.stale"
+                    os.rename(path, stale_path)
+                    os.unlink(stale_path)
+                except OSError:
+                    return False  # Another caller got there first
+                continue
+            except OSError:
+                return False
+            with os.fdopen(fd, "w") as f:
+                json.dump({"key": key, "value": True}, f)
+            return True
+        return False
+
 
-# Global cache instance
+# Global cache instances
 _cache = TTLCache()
+_disk_cache = DiskCache()
 
 
 class OptimizedSubprocess:
@@ -64,8 +173,12 @@ class OptimizedSubprocess:
     
     @staticmethod
     def run_cached(cmd: List[str], cwd: str = None, timeout: float = 2.0, 
-                   cache_key: str = None, cache_ttl: int = 10) -> Tuple[int, str, str]:
-        """Run subprocess with caching and strict timeout."""
+                   cache_key: str = None, cache_ttl: int = 10,
+                   text: bool = True) -> Tuple[int, Any, Any]:
+        """Run subprocess with caching and strict timeout.
+
+        Pass text=False to get raw bytes when output is only tested, not read.
+        """
         # Create cache key from command and cwd
         if cache_key is None:
             cache_key = f"{':'.join(cmd)}:{cwd or 'none'}"
@@ -75,20 +188,18 @@ class OptimizedSubprocess:
         if cached is not None:
             return cached
         
-        # Run with timeout using ThreadPoolExecutor for reliability
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(subprocess.run, cmd, 
-                                   capture_output=True, text=True, 
-                                   cwd=cwd, timeout=timeout)
-            try:
-                result = future.result(timeout=timeout + 0.5)  # Small buffer
-                output = (result.returncode, result.stdout or "", result.stderr or "")
-                _cache.set(cache_key, output)
-                return output
-            except (FuturesTimeoutError, subprocess.TimeoutExpired):
-                return (124, "", "Command timed out")  # 124 is timeout exit code
-            except Exception as e:
-                return (1, "", str(e))
+        # subprocess.run enforces the timeout itself and kills the child
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=text,
+                                    cwd=cwd, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return (124, "", "Command timed out")  # 124 is timeout exit code
+        except Exception as e:
+            return (1, "", str(e))
+        empty = "" if text else b""
+        output = (result.returncode, result.stdout or empty, result.stderr or empty)
+        _cache.set(cache_key, output)
+        return output
 
 
 class HookError(Exception):
@@ -104,11 +215,13 @@ class HookLogger:
     _lock = threading.Lock()
     
     @classmethod
-    def debug(cls, message: str) -> None:
-        """Write debug logs with buffering."""
-        if os.environ.get("AGENT_OS_DEBUG", "").lower() != "true":
+    def debug(cls, message: str, *args: Any) -> None:
+        """Write debug logs with buffering; args are %-formatted lazily."""
+        if not DEBUG_ENABLED:
             return
         
+        if args:
+            message = message % args
         timestamp = datetime.now().isoformat()
         log_entry = f"[{timestamp}] {message}"
         
@@ -121,33 +234,59 @@ class HookLogger:
                 cls._flush_buffer()
                 cls._last_flush = now
     
+    @classmethod
+    def flush(cls) -> None:
+        """Write any buffered entries; registered to run at process exit."""
+        with cls._lock:
+            cls._flush_buffer()
+    
     @classmethod
     def _flush_buffer(cls):
         """Flush log buffer to disk."""
         if not cls._log_buffer:
             return
         
-        log_path = Path.home() / ".agent-os" / "logs" / "hooks-debug.log"
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        
         try:
-            with open(log_path, "a") as f:
+            os.makedirs(os.path.dirname(DEBUG_LOG_PATH), exist_ok=True)
+            with open(DEBUG_LOG_PATH, "a") as f:
                 f.write("\n".join(cls._log_buffer) + "\n")
             cls._log_buffer.clear()
         except Exception:
             pass  # Don't let logging failures break hooks
 
 
+# Hooks are short-lived processes; without this most buffered entries are lost
+atexit.register(HookLogger.flush)
+
+
 class WorkspaceResolver:
     """Optimized workspace resolution."""
     
-    @staticmethod
-    def resolve(input_data: Optional[Dict[str, Any]] = None) -> str:
+    _resolver_class = None
+    _resolver_loaded = False
+    
+    @classmethod
+    def _get_resolver_class(cls):
+        """Import ProjectRootResolver on first use; None if unavailable."""
+        if not cls._resolver_loaded:
+            cls._resolver_loaded = True
+            if AGENT_OS_ROOT not in sys.path:
+                sys.path.insert(0, AGENT_OS_ROOT)
+            try:
+                from scripts.project_root_resolver import ProjectRootResolver
+                cls._resolver_class = ProjectRootResolver
+            except ImportError:
+                cls._resolver_class = None
+        return cls._resolver_class
+    
+    @classmethod
+    def resolve(cls, input_data: Optional[Dict[str, Any]] = None) -> str:
         """Fast workspace resolution with minimal fallback."""
-        # Use ProjectRootResolver if available (cached)
-        if ProjectRootResolver:
+        # Use ProjectRootResolver if available (imported lazily)
+        resolver_class = cls._get_resolver_class()
+        if resolver_class:
             try:
-                resolver = ProjectRootResolver()
+                resolver = resolver_class()
                 file_path = None
                 if input_data:
                     tool_input = input_data.get("tool_input", {}) or {}
@@ -165,35 +304,260 @@ class WorkspaceResolver:
         return os.getcwd()
 
 
+def _git_dir(cwd: str) -> Optional[str]:
+    """Locate the git directory for cwd without spawning git.
+
+    Walks up from cwd looking for ``.git``; a ``.git`` file (worktrees,
+    submodules) is followed through its ``gitdir:`` line.
+    """
+    cwd = cwd or os.getcwd()
+    env_git_dir = os.environ.get("GIT_DIR")
+    if env_git_dir:
+        return os.path.join(cwd, env_git_dir)
+    path = os.path.abspath(cwd)
+    while True:
+        candidate = os.path.join(path, ".git")
+        if os.path.isdir(candidate):
+            return candidate
+        if os.path.isfile(candidate):
+            try:
+                with open(candidate) as f:
+                    line = f.readline().strip()
+            except OSError:
+                return None
+            if line.startswith("gitdir:"):
+                return os.path.normpath(os.path.join(path, line[len("gitdir:"):].strip()))
+            return None
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def _git_state_stamp(git_dir: Optional[str]) -> str:
+    """Fold index/HEAD/packed-refs mtimes into a cache-key fragment."""
+    if not git_dir:
+        return "nogit"
+    parts = []
+    for name in ("index", "HEAD", "packed-refs"):
+        try:
+            parts.append(str(os.stat(os.path.join(git_dir, name)).st_mtime_ns))
+        except OSError:
+            parts.append("0")
+    return "-".join(parts)
+
+
+def _remote_urls(git_dir: Optional[str]) -> List[str]:
+    """Read remote URLs from the repository config without spawning git.
+
+    Only ``[remote "..."]`` sections count (not submodule or lfs URLs), and
+    origin's URLs come first so callers can key caches on urls[0].
+    """
+    if not git_dir:
+        return []
+    config_path = os.path.join(git_dir, "config")
+    commondir = os.path.join(git_dir, "commondir")
+    if not os.path.exists(config_path) and os.path.exists(commondir):
+        try:
+            with open(commondir) as f:
+                config_path = os.path.join(git_dir, f.read().strip(), "config")
+        except OSError:
+            return []
+    origin_urls, other_urls = [], []
+    remote = None  # Name of the remote section being read, if any
+    try:
+        with open(config_path) as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    # [remote "origin"], or the older [remote.origin]
+                    section = line[1:].partition("]")[0].strip()
+                    kind, _, name = section.partition(" ")
+                    if kind.lower() == "remote" and name:
+                        remote = name.strip().strip('"')
+                    elif section.lower().startswith("remote."):
+                        remote = section[len("remote."):]
+                    else:
+                        remote = None
+                    continue
+                key, sep, value = line.partition("=")
+                if remote is not None and sep and key.strip().lower() == "url":
+                    url = value.strip().strip('"')
+                    (origin_urls if remote == "origin" else other_urls).append(url)
+    except OSError:
+        pass
+    return origin_urls + other_urls
+
+
+def _remote_host(url: str) -> Optional[str]:
+    """Host name of a remote URL (URL or scp-like form); None for local paths."""
+    if "://" in url:
+        authority = url.split("://", 1)[1].split("/", 1)[0]
+    elif ":" in url.split("/", 1)[0]:
+        authority = url.split(":", 1)[0]  # user@host:owner/repo
+    else:
+        return None
+    host = authority.rpartition("@")[2].split(":", 1)[0]
+    return host.lower() or None
+
+
+# Per-workspace marker that a warm run was started recently; it finishes
+# well within WARM_INFLIGHT_TTL
+WARM_INFLIGHT_KEY = "warm-inflight"
+WARM_INFLIGHT_TTL = 10
+
+
+def start_cache_warm(cwd: str) -> None:
+    """Spawn a detached dispatcher run that refreshes the workflow caches.
+
+    At most one run per workspace is started per WARM_INFLIGHT_TTL seconds,
+    however many hook processes or threads ask for one.
+    """
+    if not _disk_cache.claim(f"{WARM_INFLIGHT_KEY}:{os.path.abspath(cwd)}", WARM_INFLIGHT_TTL):
+        return
+    try:
+        proc = subprocess.Popen(
+            [sys.executable, DISPATCHER_SCRIPT, "warm"],
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL, cwd=cwd,
+            start_new_session=True
+        )
+        proc.stdin.write(b"{}")
+        proc.stdin.close()
+    except Exception as e:
+        HookLogger.debug("Cache warm could not start: %s", e)
+
+
 class GitChecker:
     """Optimized git checks with aggressive caching."""
     
+    # Seconds a git status answer is trusted for unchanged .git state, and
+    # how long an older answer may still be served while a refresh runs
+    STATUS_CACHE_TTL = 5
+    STATUS_STALE_TTL = 25
+    
     @staticmethod
-    def has_uncommitted_changes(cwd: str) -> bool:
-        """Check git status with caching."""
+    def has_uncommitted_changes(cwd: str, allow_stale: bool = True) -> bool:
+        """Check git status for changes to tracked files, with caching.
+
+        Untracked files are intentionally ignored: listing them means walking
+        the whole worktree, which dominates `git status` time in large repos,
+        and new files only matter to the workflow gate once they are staged.
+
+        Each answer is stored with a stamp of the mtimes of .git/index, HEAD
+        and packed-refs, so staging, committing or switching branches
+        invalidates it at once; the short TTL still bounds staleness for
+        unstaged worktree edits. There is one cache file per worktree.
+        Results are shared with later hook processes through the disk cache.
+        A stale answer (up to STATUS_STALE_TTL) is returned at once and a
+        detached warm run refreshes it, unless allow_stale is False.
+        """
         try:
+            git_dir = _git_dir(cwd)
+            if not git_dir:
+                return False  # Not a work tree; nothing to report
+            stamp = _git_state_stamp(git_dir)
+            cache_key = f"git-status:{cwd}"
+            cached, is_stale = _disk_cache.get_swr(
+                cache_key, GitChecker.STATUS_CACHE_TTL,
+                GitChecker.STATUS_STALE_TTL if allow_stale else GitChecker.STATUS_CACHE_TTL
+            )
+            # An answer recorded for another .git state is a miss
+            if (isinstance(cached, dict) and cached.get("stamp") == stamp
+                    and isinstance(cached.get("dirty"), bool)):
+                if is_stale:
+                    start_cache_warm(cwd)
+                return cached["dirty"]
+            
             returncode, stdout, _ = OptimizedSubprocess.run_cached(
-                ["git", "status", "--porcelain"], 
-                cwd=cwd, timeout=3.0, cache_ttl=5
+                ["git", "--no-optional-locks", "status", "--porcelain=v2",
+                 "--untracked-files=no", "-z"],
+                cwd=cwd, timeout=3.0, cache_ttl=GitChecker.STATUS_CACHE_TTL,
+                cache_key=f"{cache_key}:{stamp}", text=False
             )
-            return returncode == 0 and bool(stdout.strip())
+            if returncode != 0:
+                return False
+            has_changes = bool(stdout.strip())
+            _disk_cache.set(cache_key, {"stamp": stamp, "dirty": has_changes})
+            return has_changes
         except Exception:
             return False
     
+    # Hosted forges that are never GitHub; gh cannot answer for their remotes
+    NON_GITHUB_HOSTS = frozenset({
+        "gitlab.com", "bitbucket.org", "codeberg.org", "git.sr.ht",
+        "dev.azure.com", "ssh.dev.azure.com", "vs-ssh.visualstudio.com", "gitee.com"
+    })
+    
+    @staticmethod
+    def has_github_remote(cwd: str) -> bool:
+        """Cheap pre-check so `gh` is only spawned when it could succeed.
+
+        Only remotes on hosts known not to be GitHub (and local paths) are
+        ruled out; any other host may be GitHub Enterprise, so gh decides.
+        """
+        git_dir = _git_dir(cwd)
+        if not git_dir:
+            return True  # Unknown layout; let gh decide
+        if os.environ.get("GH_HOST"):
+            return True
+        for url in _remote_urls(git_dir):
+            host = _remote_host(url)
+            if host and host not in GitChecker.NON_GITHUB_HOSTS:
+                return True
+        return False
+    
+    # Seconds an open-PR answer is reused across hook processes, and how
+    # long an older answer may still be served while a refresh runs
+    PR_CACHE_TTL = 60
+    PR_STALE_TTL = 300
+    
+    # Seconds to stop asking gh after it reports it is not signed in
+    GH_UNAUTHENTICATED_TTL = 600
+    GH_UNAUTHENTICATED_KEY = "gh-unauthenticated"
+    
     @staticmethod
-    def has_open_prs(cwd: str) -> bool:
-        """Check for open PRs with caching."""
+    def has_open_prs(cwd: str, allow_stale: bool = True) -> bool:
+        """Check for open PRs, reusing a recent answer for the same remote.
+
+        Like has_uncommitted_changes, a stale answer (up to PR_STALE_TTL) is
+        served while a detached warm run refreshes it.
+        """
         try:
-            returncode, stdout, _ = OptimizedSubprocess.run_cached(
-                ["gh", "pr", "list", "--state", "open", "--json", "number"], 
+            if not GitChecker.has_github_remote(cwd):
+                return False
+            urls = _remote_urls(_git_dir(cwd))
+            disk_key = f"open-prs:{urls[0] if urls else os.path.abspath(cwd)}"
+            cached, is_stale = _disk_cache.get_swr(
+                disk_key, GitChecker.PR_CACHE_TTL,
+                GitChecker.PR_STALE_TTL if allow_stale else GitChecker.PR_CACHE_TTL
+            )
+            if isinstance(cached, bool):
+                if is_stale:
+                    start_cache_warm(cwd)
+                return cached
+            
+            # gh that is missing or signed out cannot answer; don't spawn it
+            if shutil.which("gh") is None:
+                return False
+            if _disk_cache.get(GitChecker.GH_UNAUTHENTICATED_KEY,
+                               GitChecker.GH_UNAUTHENTICATED_TTL):
+                return False
+            
+            returncode, stdout, stderr = OptimizedSubprocess.run_cached(
+                ["gh", "pr", "list", "--state", "open", "--limit", "1",
+                 "--json", "number", "--jq", "length"],
                 cwd=cwd, timeout=3.0, cache_ttl=15
             )
+            if returncode != 0 and "gh auth login" in stderr:
+                _disk_cache.set(GitChecker.GH_UNAUTHENTICATED_KEY, True)
             if returncode == 0:
                 try:
-                    prs = json.loads(stdout or "[]")
-                    return len(prs) > 0
-                except json.JSONDecodeError:
+                    has_prs = int(stdout.strip() or "0") > 0
+                except ValueError:
                     return False
+                _disk_cache.set(disk_key, has_prs)
+                return has_prs
             return False
         except Exception:
             return False
@@ -202,45 +566,100 @@ class GitChecker:
 class IntentAnalyzer:
     """Optimized intent analysis with fallback and caching."""
     
+    VALID_INTENTS = frozenset({"MAINTENANCE", "NEW", "AMBIGUOUS"})
+    
+    # Seconds a classified prompt is reused across hook processes; recent
+    # answers share one bounded cache file
+    INTENT_CACHE_TTL = 600
+    INTENT_CACHE_KEY = "recent-intents"
+    INTENT_CACHE_SIZE = 256
+    
+    # Intent is decided by the opening of a prompt; longer pastes only add
+    # analyzer time and argv size
+    INTENT_TEXT_LIMIT = 512
+    
     @staticmethod
     def get_intent(prompt_text: str = "") -> str:
         """Fast intent analysis with environment override."""
-        # Environment override (fastest path)
-        env_intent = os.environ.get("AGENT_OS_INTENT", "").strip().upper()
-        if env_intent in {"MAINTENANCE", "NEW", "AMBIGUOUS"}:
-            return env_intent
+        # Environment override (fastest path); unset skips the normalisation
+        if env_intent := os.environ.get("AGENT_OS_INTENT"):
+            env_intent = env_intent.strip().upper()
+            if env_intent in IntentAnalyzer.VALID_INTENTS:
+                return env_intent
         
         # Use cached analyzer with short timeout
         text = prompt_text or os.environ.get("CLAUDE_USER_PROMPT", "")
         if not text.strip():
             return "AMBIGUOUS"
+        text = text[:IntentAnalyzer.INTENT_TEXT_LIMIT]
+        
+        # Key by digest so prompt text is never written to the cache
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        recent = _disk_cache.get(IntentAnalyzer.INTENT_CACHE_KEY, IntentAnalyzer.INTENT_CACHE_TTL)
+        if not isinstance(recent, dict):
+            recent = {}
+        try:
+            cached, saved_at = recent[digest]
+            if (cached in IntentAnalyzer.VALID_INTENTS
+                    and time.time() - saved_at <= IntentAnalyzer.INTENT_CACHE_TTL):
+                return cached
+        except (KeyError, TypeError, ValueError):
+            pass
         
         try:
             returncode, stdout, _ = OptimizedSubprocess.run_cached(
-                [os.path.expanduser("~/.agent-os/scripts/intent-analyzer.sh"), "--text", text],
+                [INTENT_ANALYZER_SCRIPT, "--text", text],
                 timeout=2.0, cache_ttl=30
             )
             val = (stdout or "").strip().upper()
-            return val if val in {"MAINTENANCE", "NEW", "AMBIGUOUS"} else "AMBIGUOUS"
+            if val in IntentAnalyzer.VALID_INTENTS:
+                IntentAnalyzer._remember(recent, digest, val)
+                return val
+            return "AMBIGUOUS"
         except Exception:
             return "AMBIGUOUS"
+    
+    @staticmethod
+    def _remember(recent: Dict[str, Any], digest: str, intent: str) -> None:
+        """Add an answer to the recent-intents file, dropping expired and oldest entries."""
+        now = time.time()
+        entries = [
+            (key, entry) for key, entry in recent.items()
+            if key != digest and isinstance(entry, list) and len(entry) == 2
+            and isinstance(entry[1], (int, float))
+            and now - entry[1] <= IntentAnalyzer.INTENT_CACHE_TTL
+        ]
+        # Keep the newest entries, leaving room for this one
+        entries.sort(key=lambda item: item[1][1])
+        del entries[:max(0, len(entries) - IntentAnalyzer.INTENT_CACHE_SIZE + 1)]
+        entries.append((digest, [intent, now]))
+        _disk_cache.set(IntentAnalyzer.INTENT_CACHE_KEY, dict(entries))
 
 
 class SpecChecker:
     """Optimized spec detection with filesystem caching."""
     
+    SPEC_CACHE_TTL = 10
+    
     @staticmethod
     def has_active_spec(cwd: str) -> bool:
-        """Fast spec detection with caching."""
+        """Fast spec detection with caching.
+
+        True if .agent-os/specs has any entry other than dotfiles such as
+        .gitkeep or .DS_Store (matching what `ls` would list).
+        """
+        cache_key = f"spec:{cwd}"
+        cached = _cache.get(cache_key, SpecChecker.SPEC_CACHE_TTL)
+        if cached is not None:
+            return cached
+        
         try:
-            returncode, stdout, _ = OptimizedSubprocess.run_cached(
-                ["bash", "-lc", "ls -1 .agent-os/specs 2>/dev/null | wc -l"],
-                cwd=cwd, timeout=2.0, cache_ttl=10
-            )
-            count = int((stdout or "0").strip())
-            return returncode == 0 and count > 0
-        except (ValueError, Exception):
+            with os.scandir(os.path.join(cwd, ".agent-os", "specs")) as entries:
+                has_spec = any(not entry.name.startswith(".") for entry in entries)
+        except OSError:
             return False
+        _cache.set(cache_key, has_spec)
+        return has_spec
 
 
 class BaseHookHandler:
@@ -249,6 +668,7 @@ class BaseHookHandler:
     def __init__(self, input_data: Dict[str, Any]):
         self.input_data = input_data
         self._workspace_root = None  # Lazy initialization
+        self._workflow_issues = None  # Memoized per hook invocation
         
     @property
     def workspace_root(self) -> str:
@@ -257,9 +677,10 @@ class BaseHookHandler:
             self._workspace_root = WorkspaceResolver.resolve(self.input_data)
         return self._workspace_root
     
-    def log_debug(self, message: str) -> None:
-        """Log debug message."""
-        HookLogger.debug(f"{self.__class__.__name__}: {message}")
+    def log_debug(self, message: str, *args: Any) -> None:
+        """Log debug message; formatting is skipped when debugging is off."""
+        if DEBUG_ENABLED:
+            HookLogger.debug(f"{self.__class__.__name__}: {message}", *args)
     
     def get_tool_name(self) -> str:
         """Get the tool name from input data."""
@@ -272,26 +693,30 @@ class BaseHookHandler:
     def exit_allow(self, reason: str = "") -> None:
         """Exit with success (allow the operation)."""
         if reason:
-            self.log_debug(f"Allowing: {reason}")
+            self.log_debug("Allowing: %s", reason)
         sys.exit(0)
     
     def exit_block(self, reason: str) -> None:
         """Exit with error (block the operation)."""
-        self.log_debug(f"Blocking: {reason}")
+        self.log_debug("Blocking: %s", reason)
         print(reason, file=sys.stderr)
         sys.exit(2)
     
     def check_work_session(self) -> bool:
         """Fast work session check."""
-        work_session_active = os.environ.get("AGENT_OS_WORK_SESSION", "").lower() == "true"
-        if work_session_active:
+        if WORK_SESSION_ENV_ACTIVE:
             return True
         
-        session_file = os.path.expanduser("~/.agent-os/cache/work-session")
-        return os.path.exists(session_file)
+        return os.path.exists(WORK_SESSION_FILE)
     
     def check_workflow_status(self) -> List[str]:
-        """Optimized workflow status check."""
+        """Optimized workflow status check, memoized for this invocation."""
+        if self._workflow_issues is None:
+            self._workflow_issues = self._compute_workflow_status()
+        return list(self._workflow_issues)
+    
+    def _compute_workflow_status(self) -> List[str]:
+        """Run the git/PR hygiene checks."""
         issues = []
         
         # Skip expensive checks in work session mode
@@ -299,22 +724,22 @@ class BaseHookHandler:
             self.log_debug("Work session mode active - skipping hygiene checks")
             return issues
         
-        # Use parallel execution for git checks
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            git_future = executor.submit(GitChecker.has_uncommitted_changes, self.workspace_root)
-            pr_future = executor.submit(GitChecker.has_open_prs, self.workspace_root)
-            
-            try:
-                if git_future.result(timeout=3.0):
-                    issues.append("Uncommitted changes detected")
-            except Exception:
-                pass
-            
-            try:
-                if pr_future.result(timeout=3.0):
-                    issues.append("Open pull requests need review/merge")
-            except Exception:
-                pass
+        # Overlap the slow gh call with git status, which runs on this thread
+        workspace_root = self.workspace_root
+        pr_result = []
+        pr_thread = threading.Thread(
+            target=lambda: pr_result.append(GitChecker.has_open_prs(workspace_root)),
+            daemon=True
+        )
+        pr_thread.start()
+        
+        if GitChecker.has_uncommitted_changes(workspace_root):
+            issues.append("Uncommitted changes detected")
+        
+        # A daemon thread cannot delay hook exit if gh overruns the timeout
+        pr_thread.join(timeout=3.0)
+        if pr_result and pr_result[0]:
+            issues.append("Open pull requests need review/merge")
         
         return issues
     
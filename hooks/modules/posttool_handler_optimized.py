@@ -5,20 +5,31 @@ Handles PostToolUse hook - auto-commit Agent OS documentation changes.
 Focused on single responsibility: post-tool cleanup and documentation sync.
 """
 
-import os
 import subprocess
 import sys
-from .hook_core_optimized import BaseHookHandler
+from .hook_core_optimized import BaseHookHandler, UPDATE_DOCUMENTATION_SCRIPT, start_cache_warm
 
 
 class PostToolHandler(BaseHookHandler):
     """Handles PostToolUse hook with focused responsibility."""
     
+    # Tools that cannot change files, so cannot create documentation drift
+    READONLY_TOOLS = frozenset({
+        "Read", "Glob", "Grep", "LS", "WebFetch", "WebSearch", "TodoWrite"
+    })
+    
     def handle(self) -> None:
         """Main PostTool handler logic."""
         tool_name = self.get_tool_name()
         
-        self.log_debug(f"PostToolUse called for tool: {tool_name}")
+        self.log_debug("PostToolUse called for tool: %s", tool_name)
+        
+        # Skip the (slow) documentation scan when nothing could have changed
+        if tool_name in self.READONLY_TOOLS:
+            self.exit_allow("Read-only tool; no documentation check needed")
+        
+        # Refresh git/PR caches in the background for the next PreTool call
+        self._start_cache_warm()
         
         # Check if documentation updates are required
         self._check_documentation_status()
@@ -26,12 +37,20 @@ class PostToolHandler(BaseHookHandler):
         # Future: Add other post-tool cleanup logic here
         self.exit_allow("PostTool checks completed")
     
+    def _start_cache_warm(self) -> None:
+        """Spawn a detached dispatcher run that refreshes workflow caches."""
+        if self.check_work_session():
+            return
+        start_cache_warm(self.workspace_root)
+    
     def _check_documentation_status(self) -> None:
         """Check if documentation updates are required after tool use."""
         try:
-            # Run documentation updater in dry-run mode
+            # Run documentation updater in dry-run mode. Deliberately uncached:
+            # this runs right after a tool may have edited files, and unstaged
+            # edits leave .git untouched, so a cached answer would miss them
             result = subprocess.run([
-                os.path.expanduser("~/.agent-os/scripts/update-documentation.sh"),
+                UPDATE_DOCUMENTATION_SCRIPT,
                 "--dry-run",
                 "--deep"
             ], capture_output=True, text=True, timeout=30, cwd=self.workspace_root)
@@ -50,6 +69,6 @@ class PostToolHandler(BaseHookHandler):
         except subprocess.TimeoutExpired:
             self.log_debug("Documentation check timed out")
         except Exception as e:
-            self.log_debug(f"Documentation check failed: {e}")
+            self.log_debug("Documentation check failed: %s", e)
         
         # Don't block on documentation check failures
@@ -12,36 +12,53 @@ import subprocess
 import sys
 from typing import Dict, Any
 
-# Prefer absolute import when the modules directory is on sys.path
+# Prefer package-relative import (the dispatcher's path); it fails fast
+# without a sys.path search when loaded as a top-level module
 try:
-    from hook_core_optimized import BaseHookHandler, IntentAnalyzer, SpecChecker
-except Exception:
-    # Fallback for package-relative import
-    from .hook_core_optimized import BaseHookHandler, IntentAnalyzer, SpecChecker
+    from .hook_core_optimized import (
+        BaseHookHandler, IntentAnalyzer, SpecChecker, UPDATE_DOCUMENTATION_SCRIPT
+    )
+except ImportError:
+    # Fallback when the modules directory itself is on sys.path
+    from hook_core_optimized import (
+        BaseHookHandler, IntentAnalyzer, SpecChecker, UPDATE_DOCUMENTATION_SCRIPT
+    )
 
 
 class BashCommandAnalyzer:
     """Analyzes Bash commands for write operations and safety."""
     
-    READONLY_PREFIXES = [
+    # Tuple so str.startswith can test every prefix in one C-level call
+    READONLY_PREFIXES = (
         "cd ", "ls ", "ls", "cat ", "head ", "tail ", "grep ", "rg ", "find ",
         "ps ", "netstat", "lsof ", "echo ", "env", "which ", "pwd",
         "wc ", "sort ", "uniq ", "awk ", "sed "
-    ]
+    )
     
-    WRITE_PREFIXES = [
-        "cp ", "mv ", "rm ", "touch ", "chmod ", "chown ", "tee ", "patch ", 
-        "git apply ", "npm ", "yarn ", "pnpm ", "pip ", "uv ", "docker "
-    ]
+    # Programs that write when invoked, keyed by the command's first token
+    WRITE_COMMANDS = frozenset({
+        "cp", "mv", "rm", "touch", "chmod", "chown", "tee", "patch",
+        "npm", "yarn", "pnpm", "pip", "uv", "docker"
+    })
+    
+    # Multi-word write commands: first token -> write subcommands
+    WRITE_SUBCOMMANDS = {
+        "git": frozenset({"apply"})
+    }
     
     @staticmethod
     def is_write_command(command: str) -> bool:
         """Detect if command performs write operations."""
         c = command.strip()
         
-        # Obvious write commands
-        if any(c.startswith(p) for p in BashCommandAnalyzer.WRITE_PREFIXES):
-            return True
+        # Obvious write commands, dispatched on the first token
+        words = c.split(None, 2)
+        if words:
+            if words[0] in BashCommandAnalyzer.WRITE_COMMANDS:
+                return True
+            subcommands = BashCommandAnalyzer.WRITE_SUBCOMMANDS.get(words[0])
+            if subcommands and len(words) > 1 and words[1] in subcommands:
+                return True
         
         # Echo with redirection
         if c.startswith("echo ") and (">" in c or ">>" in c):
@@ -53,16 +70,18 @@ class BashCommandAnalyzer:
         
         return False
     
+    @staticmethod
+    def has_readonly_prefix(command: str) -> bool:
+        """Detect if command starts with a read-only program."""
+        c = command.strip()
+        return c.startswith(BashCommandAnalyzer.READONLY_PREFIXES)
+    
     @staticmethod
     def is_readonly_command(command: str) -> bool:
         """Detect if command is clearly read-only."""
-        c = command.strip()
-        
         # Check against readonly prefixes and ensure no write operations
-        is_readonly = any(c.startswith(p) for p in BashCommandAnalyzer.READONLY_PREFIXES)
-        has_write = BashCommandAnalyzer.is_write_command(c)
-        
-        return is_readonly and not has_write
+        return (BashCommandAnalyzer.has_readonly_prefix(command) and
+                not BashCommandAnalyzer.is_write_command(command))
     
     @staticmethod
     def is_docs_only_command(command: str) -> bool:
@@ -80,16 +99,27 @@ class BashCommandAnalyzer:
 class DocumentationChecker:
     """Handles documentation status validation for PR operations."""
     
+    # PR creation/merge commands, compiled once per process
+    PR_COMMAND_PATTERN = re.compile(r"\s*(gh\s+pr\s+(create|merge)\b)")
+    
+    @staticmethod
+    def is_pr_command(command: str) -> bool:
+        """Detect PR creation/merge commands."""
+        # Literal pre-check: most commands never mention "pr", skip the regex
+        if "pr" not in command:
+            return False
+        return DocumentationChecker.PR_COMMAND_PATTERN.match(command) is not None
+    
     @staticmethod
     def check_docs_before_pr(command: str, workspace_root: str) -> None:
         """Check if docs are up-to-date before PR creation/merge."""
         # Match PR creation/merge commands
-        if not re.match(r"\s*(gh\s+pr\s+(create|merge)\b)", command):
+        if not DocumentationChecker.is_pr_command(command):
             return
         
         try:
             result = subprocess.run([
-                os.path.expanduser("~/.agent-os/scripts/update-documentation.sh"),
+                UPDATE_DOCUMENTATION_SCRIPT,
                 "--deep", "--dry-run"
             ], capture_output=True, text=True, timeout=30, cwd=workspace_root)
             
@@ -108,14 +138,14 @@ class PreToolHandler(BaseHookHandler):
     """Handles PreToolUse hook with focused responsibility."""
     
     # Tools that indicate starting new work
-    NEW_WORK_TOOLS = ["Write", "Edit", "MultiEdit", "Update", "Task"]
+    NEW_WORK_TOOLS = frozenset({"Write", "Edit", "MultiEdit", "Update", "Task"})
     
     def handle(self) -> None:
         """Main PreTool handler logic."""
         tool_name = self.get_tool_name()
         tool_input = self.get_tool_input()
         
-        self.log_debug(f"PreToolUse called for tool: {tool_name}")
+        self.log_debug("PreToolUse called for tool: %s", tool_name)
         
         # Handle Bash commands with special logic
         if tool_name == "Bash":
@@ -132,34 +162,34 @@ class PreToolHandler(BaseHookHandler):
     def _handle_bash_command(self, command: str) -> None:
         """Handle Bash command validation."""
         # PR creation/merge guard: require docs up-to-date
-        DocumentationChecker.check_docs_before_pr(command, self.workspace_root)
+        # (workspace_root is only resolved when the command is a PR command)
+        if DocumentationChecker.is_pr_command(command):
+            DocumentationChecker.check_docs_before_pr(command, self.workspace_root)
         
         # Always allow git/gh operations (to resolve hygiene issues)
         if BashCommandAnalyzer.is_git_gh_command(command):
             self.exit_allow(f"Git/gh command allowed: {command}")
         
+        # Classify once; the read-only and write paths share the result
+        is_write = BashCommandAnalyzer.is_write_command(command)
+        
         # Allow clearly read-only commands
-        if BashCommandAnalyzer.is_readonly_command(command):
+        if not is_write and BashCommandAnalyzer.has_readonly_prefix(command):
             self.exit_allow(f"Read-only command allowed: {command}")
         
         # Handle write commands based on intent and context
-        self._handle_write_command(command)
+        self._handle_write_command(command, is_write)
     
-    def _handle_write_command(self, command: str) -> None:
+    def _handle_write_command(self, command: str, is_write: bool) -> None:
         """Handle write command validation based on intent."""
-        is_write = BashCommandAnalyzer.is_write_command(command)
-        
         # Allow docs-only writes regardless of intent
         if is_write and BashCommandAnalyzer.is_docs_only_command(command):
             self.exit_allow(f"Docs-only write allowed: {command}")
         
-        # Get user intent
-        intent = IntentAnalyzer.get_intent()
-        
         # For write operations, check intent and enforce workflow
         if is_write:
-            # Allow maintenance writes
-            if intent == "MAINTENANCE":
+            # Allow maintenance writes (intent is only analysed for writes)
+            if IntentAnalyzer.get_intent() == "MAINTENANCE":
                 self.exit_allow(f"Maintenance write allowed: {command}")
             
             # For NEW or AMBIGUOUS intent, enforce spec and hygiene
@@ -6,6 +6,7 @@ Handles Task tool validation - enforces subagent usage for complex work.
 Focused on single responsibility: Task tool quality assurance.
 """
 
+import re
 import sys
 from .hook_core_optimized import BaseHookHandler
 
@@ -14,17 +15,20 @@ class TaskHandler(BaseHookHandler):
     """Handles Task tool validation with focused responsibility."""
     
     # Keywords that indicate review/validation work needing subagents
-    REVIEW_KEYWORDS = [
+    REVIEW_KEYWORDS = (
         "review", "validate", "check", "verify", "test", "analyze", 
         "debug", "troubleshoot", "investigate", "audit"
-    ]
+    )
+    
+    # Single substring scan over the description, built once at import
+    REVIEW_PATTERN = re.compile("|".join(map(re.escape, REVIEW_KEYWORDS)))
     
     def handle(self) -> None:
         """Main Task handler logic."""
         tool_input = self.get_tool_input()
         description = tool_input.get("description", "").lower()
         
-        self.log_debug(f"Task tool called with description: {description}")
+        self.log_debug("Task tool called with description: %s", description)
         
         # Check if this task should use specialized subagents
         if self._needs_subagent(description):
@@ -34,7 +38,7 @@ class TaskHandler(BaseHookHandler):
     
     def _needs_subagent(self, description: str) -> bool:
         """Check if task description indicates need for specialized subagents."""
-        return any(keyword in description for keyword in self.REVIEW_KEYWORDS)
+        return self.REVIEW_PATTERN.search(description) is not None
     
     def _recommend_subagent(self) -> None:
         """Block task and recommend appropriate subagent."""
@@ -16,17 +16,18 @@ class UserPromptHandler(BaseHookHandler):
     """Handles UserPromptSubmit hook with focused responsibility."""
     
     # Patterns that indicate user wants to proceed with new work
-    PROCEED_PATTERNS = [
+    PROCEED_PATTERNS = (
         r"\b(proceed|continue|next|what'?s next|task \d+|move on|start|begin)\b",
         r"ready for .*task",
         r"let'?s (do|start|work on)",
-    ]
+    )
+    PROCEED_PATTERN = re.compile("|".join(PROCEED_PATTERNS), re.IGNORECASE)
     
     def handle(self) -> None:
         """Main UserPrompt handler logic."""
-        prompt = self.input_data.get("prompt", "").lower()
+        prompt = self.input_data.get("prompt", "")
         
-        self.log_debug(f"UserPromptSubmit called with prompt: {prompt[:100]}...")
+        self.log_debug("UserPromptSubmit called with prompt: %.100s...", prompt)
         
         # Check if user is trying to proceed with new work
         if not self._is_proceed_attempt(prompt):
@@ -37,7 +38,7 @@ class UserPromptHandler(BaseHookHandler):
     
     def _is_proceed_attempt(self, prompt: str) -> bool:
         """Check if prompt indicates user wants to proceed with work."""
-        return any(re.search(pattern, prompt) for pattern in self.PROCEED_PATTERNS)
+        return self.PROCEED_PATTERN.search(prompt) is not None
     
     def _handle_proceed_attempt(self, prompt: str) -> None:
         """Handle user attempts to proceed with new work."""
@@ -59,7 +60,8 @@ class UserPromptHandler(BaseHookHandler):
                 "decision": "block",
                 "hookSpecificOutput": {"additionalContext": message}
             }
-            print(json.dumps(output))
+            json.dump(output, sys.stdout)
+            sys.stdout.write("\n")
             self.exit_allow("Proceed blocked due to workflow issues")
         
         # All checks passed
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Agent OS Cache Warm Handler
+===========================
+Runs detached after PostToolUse to refresh workflow caches.
+Focused on single responsibility: precomputing git/PR state so the next
+PreToolUse hook finds a warm disk cache instead of spawning git and gh.
+"""
+
+from .hook_core_optimized import BaseHookHandler, GitChecker
+
+
+class WarmHandler(BaseHookHandler):
+    """Refreshes the shared git status and open-PR cache entries."""
+
+    def handle(self) -> None:
+        """Populate caches; never reports or blocks anything."""
+        # Hygiene checks are skipped in work sessions, so nothing to warm
+        if self.check_work_session():
+            self.exit_allow("Work session active; nothing to warm")
+
+        workspace_root = self.workspace_root
+        # Never serve stale answers here: this run is the refresh
+        GitChecker.has_uncommitted_changes(workspace_root, allow_stale=False)
+        GitChecker.has_open_prs(workspace_root, allow_stale=False)
+        self.exit_allow("Workflow caches warmed")
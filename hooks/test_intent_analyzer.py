@@ -133,6 +133,27 @@ class TestIntentAnalyzer(unittest.TestCase):
                 result = self.analyzer.analyze_intent(message)
                 self.assertEqual(result.intent_type, expected_type)
 
+    def test_non_ascii_letters_are_not_word_boundaries(self):
+        """Test that accented letters inside a word do not end it."""
+        for message in ["Patchänderung vorbereiten", "Debugâ logs"]:
+            with self.subTest(message=message):
+                result = self.analyzer.analyze_intent(message)
+                self.assertEqual(result.intent_type, IntentType.AMBIGUOUS)
+
+    def test_ascii_pattern_sets_agree_on_ascii_messages(self):
+        """Test the re.ASCII pattern sets give the same matches as the Unicode ones."""
+        messages = self.maintenance_messages + self.new_work_messages + self.ambiguous_messages
+        pattern_sets = [
+            (self.analyzer.compiled_maintenance_patterns, self.analyzer._ascii_maintenance_patterns),
+            (self.analyzer.compiled_new_work_patterns, self.analyzer._ascii_new_work_patterns),
+        ]
+        for message in messages:
+            for unicode_set, ascii_set in pattern_sets:
+                with self.subTest(message=message):
+                    self.assertEqual(
+                        [bool(p.search(message)) for p in ascii_set],
+                        [bool(p.search(message)) for p in unicode_set])
+
     def test_performance_requirement(self):
         """Test that intent analysis completes within performance requirements."""
         import time
@@ -149,6 +170,104 @@ class TestIntentAnalyzer(unittest.TestCase):
             f"Intent analysis took {analysis_time:.3f}s, should be < 0.1s")
         self.assertIsInstance(result, WorkIntentResult)
 
+    def test_long_repetitive_message_performance(self):
+        """Test that repeated trigger words do not cause quadratic matching."""
+        import time
+
+        start_time = time.time()
+        self.analyzer.analyze_intent("fix " * 5000)
+        analysis_time = time.time() - start_time
+
+        self.assertLess(analysis_time, 2.0,
+            f"Intent analysis took {analysis_time:.3f}s on a long repetitive message")
+
+    def test_lookahead_guard_spans_whole_message(self):
+        """Test that 'refactor ... new' stays ambiguous however far apart the words are."""
+        message = "refactor the module and " + "the helpers and " * 7 + "make it new"
+        result = self.analyzer.analyze_intent(message)
+        self.assertEqual(result.intent_type, IntentType.AMBIGUOUS)
+
+    def test_long_gaps_keep_classification(self):
+        """Test words far apart still match, and results report the configured patterns."""
+        cases = [
+            ("implement the thing we discussed yesterday in the long planning meeting "
+             "with the product team, including the notification system", IntentType.NEW_WORK),
+            ("please fix: " + "x" * 90 + " bug", IntentType.MAINTENANCE),
+        ]
+        for message, expected in cases:
+            with self.subTest(message=message):
+                result = self.analyzer.analyze_intent(message)
+                self.assertEqual(result.intent_type, expected)
+                for pattern in result.matched_patterns:
+                    self.assertIn(pattern, self.analyzer._get_default_maintenance_patterns() +
+                                  self.analyzer._get_default_new_work_patterns())
+
+    def test_gap_search_equals_regex_search(self):
+        """Test the backtracking-free gap search agrees with re.search."""
+        from intent_analyzer import _pattern_searchers
+        messages = (self.maintenance_messages + self.new_work_messages + self.ambiguous_messages + [
+            "fix the login\nbug in the header",
+            "fix it\nfix the bug",
+            "implement user\nuser profile",
+            "implement the user dashboard\n",
+            "refactor the code\nthen build it new",
+            "Fix " * 50 + "bugs",
+        ])
+        for compiled in (self.analyzer.compiled_maintenance_patterns,
+                         self.analyzer.compiled_new_work_patterns):
+            for pattern, search in zip(compiled, _pattern_searchers(compiled)):
+                for message in messages:
+                    with self.subTest(pattern=pattern.pattern, message=message):
+                        self.assertEqual(bool(search(message)), bool(pattern.search(message)))
+
+    def test_repeated_messages_use_cache(self):
+        """Test that repeated messages are served from the per-instance cache."""
+        first = self.analyzer.analyze_intent("Fix the failing tests")
+        second = self.analyzer.analyze_intent("  Fix the failing tests ")
+
+        self.assertEqual(self.analyzer._analyze_cached.cache_info().hits, 1)
+        self.assertIs(second, first)
+
+    def test_analyze_many_matches_single_analysis(self):
+        """Test that batch analysis agrees with one-at-a-time analysis."""
+        messages = (self.maintenance_messages + self.new_work_messages +
+                    self.ambiguous_messages + self.edge_case_messages +
+                    ["fix the failing unit tests"])
+        results = IntentAnalyzer().analyze_many(messages)
+
+        self.assertEqual(len(results), len(messages))
+        for message, result in zip(messages, results):
+            with self.subTest(message=message):
+                self.assertEqual(result, self.analyzer.analyze_intent(message))
+
+    def test_prefiltered_matching_equals_full_scan(self):
+        """Test that the trigger-word index and combined screen never drop a match."""
+        messages = (self.maintenance_messages + self.new_work_messages +
+                    self.ambiguous_messages + ["Fix the BUILD, then add a new service"])
+        pattern_sets = [
+            (self.analyzer.compiled_maintenance_patterns,
+             self.analyzer._maintenance_prefilter, self.analyzer._maintenance_index),
+            (self.analyzer.compiled_new_work_patterns,
+             self.analyzer._new_work_prefilter, self.analyzer._new_work_index),
+        ]
+        for message in messages:
+            for compiled, prefilter, index in pattern_sets:
+                with self.subTest(message=message):
+                    expected = [p.pattern for p in compiled if p.search(message)]
+                    self.assertEqual(
+                        self.analyzer._find_pattern_matches(message, compiled, index), expected)
+                    # Sets without trigger words fall back to the combined screen
+                    self.assertEqual(
+                        self.analyzer._find_pattern_matches(message, compiled, prefilter=prefilter),
+                        expected)
+
+    def test_prefilter_not_built_when_index_exists(self):
+        """Test the combined screen is left unbuilt for sets the trigger index covers."""
+        analyzer = IntentAnalyzer()
+        analyzer.analyze_intent("Fix the failing tests")
+        self.assertNotIn('_maintenance_prefilter', analyzer.__dict__)
+        self.assertNotIn('_new_work_prefilter', analyzer.__dict__)
+
 
 class TestWorkIntentResult(unittest.TestCase):
     """Test suite for WorkIntentResult data class."""
@@ -180,6 +299,19 @@ class TestWorkIntentResult(unittest.TestCase):
         self.assertIn("NEW_WORK", result_str)
         self.assertIn("0.9", result_str)
 
+    def test_result_is_immutable(self):
+        """Test WorkIntentResult is frozen and hashable."""
+        result = WorkIntentResult(
+            intent_type=IntentType.MAINTENANCE,
+            confidence=0.85,
+            matched_patterns=("fix.*tests",),
+            reasoning="Matched maintenance pattern: fix tests"
+        )
+
+        with self.assertRaises(AttributeError):
+            result.confidence = 0.1
+        self.assertEqual(hash(result), hash(result))
+
 
 class TestConfigurationLoading(unittest.TestCase):
     """Test suite for configuration loading and validation."""
@@ -238,6 +370,24 @@ class TestConfigurationLoading(unittest.TestCase):
         analyzer = IntentAnalyzer(config_path="invalid_config.yaml")
         self.assertGreater(len(analyzer.maintenance_patterns), 0)
     
+    def test_config_reused_until_file_changes(self):
+        """Test parsed configuration is shared until the file's mtime changes."""
+        parsed = [{"confidence_threshold": 0.6}, {"confidence_threshold": 0.8}]
+        with tempfile.TemporaryDirectory() as tmpdir, \
+             patch('intent_analyzer.HAS_YAML', True), \
+             patch.dict('intent_analyzer._CONFIG_CACHE', clear=True), \
+             patch('intent_analyzer._parse_config_file', side_effect=parsed) as mock_parse:
+            config_path = os.path.join(tmpdir, "config.yaml")
+            with open(config_path, "w") as f:
+                f.write("confidence_threshold: 0.6\n")
+            first = IntentAnalyzer(config_path=config_path).config
+            self.assertIs(IntentAnalyzer(config_path=config_path).config, first)
+            self.assertEqual(mock_parse.call_count, 1)
+
+            os.utime(config_path, (0, 0))
+            self.assertEqual(IntentAnalyzer(config_path=config_path).confidence_threshold, 0.8)
+            self.assertEqual(mock_parse.call_count, 2)
+
     def test_pattern_compilation(self):
         """Test that regex patterns are properly compiled."""
         analyzer = IntentAnalyzer()
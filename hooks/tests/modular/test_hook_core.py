@@ -7,6 +7,7 @@ Validates shared utilities and base classes.
 import os
 import sys
 import tempfile
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
 
@@ -17,6 +18,7 @@ from hook_core import (
     HookLogger, WorkspaceResolver, GitChecker, 
     IntentAnalyzer, SpecChecker, BaseHookHandler
 )
+from hook_core_optimized import DiskCache, _cache, _remote_urls, start_cache_warm
 
 
 class TestHookLogger(unittest.TestCase):
@@ -24,20 +26,25 @@ class TestHookLogger(unittest.TestCase):
     
     def test_debug_logging_disabled(self):
         """Test that logging is disabled by default."""
-        with patch.dict(os.environ, {}, clear=True):
-            # Should not create log files when debugging disabled
-            HookLogger.debug("test message")
-            # No exception means success
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = os.path.join(tmpdir, "test.log")
+            with patch('hook_core_optimized.DEBUG_ENABLED', False), \
+                 patch('hook_core_optimized.DEBUG_LOG_PATH', log_path):
+                # Should not create log files when debugging disabled
+                HookLogger.debug("test message %s", 1)
+                HookLogger.flush()
+            self.assertFalse(os.path.exists(log_path))
     
     def test_debug_logging_enabled(self):
         """Test that logging works when enabled."""
-        with patch.dict(os.environ, {'AGENT_OS_DEBUG': 'true'}):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                log_path = os.path.join(tmpdir, "test.log")
-                with patch('pathlib.Path.home') as mock_home:
-                    mock_home.return_value.joinpath.return_value = log_path
-                    HookLogger.debug("test message")
-                    # Verify log was written (basic test)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = os.path.join(tmpdir, "test.log")
+            with patch('hook_core_optimized.DEBUG_ENABLED', True), \
+                 patch('hook_core_optimized.DEBUG_LOG_PATH', log_path):
+                HookLogger.debug("test message %s", 1)
+                HookLogger.flush()
+            with open(log_path) as f:
+                self.assertIn("test message 1", f.read())
 
 
 class TestWorkspaceResolver(unittest.TestCase):
@@ -64,25 +71,76 @@ class TestWorkspaceResolver(unittest.TestCase):
 class TestGitChecker(unittest.TestCase):
     """Test git-related status checks."""
     
+    def setUp(self):
+        """Create a minimal work tree and start from an empty cache."""
+        _cache.clear()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.repo = self._tmp.name
+        os.makedirs(os.path.join(self.repo, ".git"))
+        disk_cache = DiskCache(os.path.join(self.repo, "cache"))
+        patcher = patch('hook_core_optimized._disk_cache', disk_cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        which_patcher = patch('shutil.which', return_value="/usr/bin/gh")
+        self.mock_which = which_patcher.start()
+        self.addCleanup(which_patcher.stop)
+    
     @patch('subprocess.run')
     def test_has_uncommitted_changes_true(self, mock_run):
         """Test detecting uncommitted changes."""
+        mock_run.return_value.returncode = 0
         mock_run.return_value.stdout = "M file.txt\n"
-        result = GitChecker.has_uncommitted_changes("/test/path")
+        result = GitChecker.has_uncommitted_changes(self.repo)
         self.assertTrue(result)
     
     @patch('subprocess.run')
     def test_has_uncommitted_changes_false(self, mock_run):
         """Test clean git status."""
+        mock_run.return_value.returncode = 0
         mock_run.return_value.stdout = ""
-        result = GitChecker.has_uncommitted_changes("/test/path")
+        result = GitChecker.has_uncommitted_changes(self.repo)
         self.assertFalse(result)
     
+    @patch('subprocess.run')
+    def test_has_uncommitted_changes_skips_untracked_scan(self, mock_run):
+        """Test git is asked not to walk the worktree for untracked files."""
+        mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = ""
+        GitChecker.has_uncommitted_changes(self.repo)
+        self.assertIn("--untracked-files=no", mock_run.call_args[0][0])
+
+    @patch('subprocess.run')
+    def test_has_uncommitted_changes_invalidated_by_index(self, mock_run):
+        """Test the shared status answer is dropped when .git/index changes."""
+        mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = ""
+        self.assertFalse(GitChecker.has_uncommitted_changes(self.repo))
+        _cache.clear()  # Simulate a new hook process
+        self.assertFalse(GitChecker.has_uncommitted_changes(self.repo))
+        self.assertEqual(mock_run.call_count, 1)
+        
+        with open(os.path.join(self.repo, ".git", "index"), "w") as f:
+            f.write("changed")
+        mock_run.return_value.stdout = "M file.txt\0"
+        self.assertTrue(GitChecker.has_uncommitted_changes(self.repo))
+        self.assertEqual(mock_run.call_count, 2)
+        # The newer answer replaces the older one instead of adding a file
+        self.assertEqual(len(os.listdir(os.path.join(self.repo, "cache"))), 1)
+    
+    @patch('subprocess.run')
+    def test_has_uncommitted_changes_outside_work_tree(self, mock_run):
+        """Test git is not spawned outside a work tree."""
+        with tempfile.TemporaryDirectory() as tmp, \
+             patch.dict(os.environ, {"GIT_DIR": ""}):
+            self.assertFalse(GitChecker.has_uncommitted_changes(tmp))
+        mock_run.assert_not_called()
+    
     @patch('subprocess.run')
     def test_has_open_prs_true(self, mock_run):
         """Test detecting open PRs."""
         mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = '[{"number": 123}]'
+        mock_run.return_value.stdout = '1\n'
         result = GitChecker.has_open_prs("/test/path")
         self.assertTrue(result)
     
@@ -90,14 +148,195 @@ class TestGitChecker(unittest.TestCase):
     def test_has_open_prs_false(self, mock_run):
         """Test no open PRs."""
         mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = '[]'
+        mock_run.return_value.stdout = '0\n'
         result = GitChecker.has_open_prs("/test/path")
         self.assertFalse(result)
 
+    @patch('subprocess.run')
+    def test_has_open_prs_reuses_disk_cache(self, mock_run):
+        """Test a fresh PR answer is reused without spawning gh again."""
+        mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = '1\n'
+        self.assertTrue(GitChecker.has_open_prs("/test/path"))
+        _cache.clear()  # Simulate a new hook process
+        self.assertTrue(GitChecker.has_open_prs("/test/path"))
+        self.assertEqual(mock_run.call_count, 1)
+
+    @patch('hook_core_optimized.start_cache_warm')
+    @patch('subprocess.run')
+    def test_has_open_prs_serves_stale_answer_while_refreshing(self, mock_run, mock_warm):
+        """Test an expired PR answer is served at once and refreshed in the background."""
+        mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = '1\n'
+        self.assertTrue(GitChecker.has_open_prs("/test/path"))
+        _cache.clear()  # Simulate a new hook process
+        for name in os.listdir(os.path.join(self.repo, "cache")):
+            path = os.path.join(self.repo, "cache", name)
+            old = os.stat(path).st_mtime - GitChecker.PR_CACHE_TTL - 1
+            os.utime(path, (old, old))
+        
+        self.assertTrue(GitChecker.has_open_prs("/test/path"))
+        self.assertEqual(mock_run.call_count, 1)
+        mock_warm.assert_called_once_with("/test/path")
+        
+        # The warm run itself must not accept the stale answer
+        mock_run.return_value.stdout = '0\n'
+        self.assertFalse(GitChecker.has_open_prs("/test/path", allow_stale=False))
+        self.assertEqual(mock_run.call_count, 2)
+
+    @patch('subprocess.run')
+    def test_has_open_prs_skips_missing_gh(self, mock_run):
+        """Test gh is not spawned when it is not installed."""
+        self.mock_which.return_value = None
+        self.assertFalse(GitChecker.has_open_prs("/test/path"))
+        mock_run.assert_not_called()
+
+    @patch('subprocess.run')
+    def test_has_open_prs_remembers_unauthenticated_gh(self, mock_run):
+        """Test a signed-out gh is not retried by later hook processes."""
+        mock_run.return_value.returncode = 4
+        mock_run.return_value.stdout = ''
+        mock_run.return_value.stderr = 'To get started with GitHub CLI, please run:  gh auth login\n'
+        self.assertFalse(GitChecker.has_open_prs("/test/path"))
+        _cache.clear()  # Simulate a new hook process
+        self.assertFalse(GitChecker.has_open_prs("/other/path"))
+        self.assertEqual(mock_run.call_count, 1)
+
+    @patch('subprocess.run')
+    def test_has_open_prs_skips_gh_without_github_remote(self, mock_run):
+        """Test gh is not spawned for repos without a GitHub remote."""
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, ".git"))
+            with open(os.path.join(tmp, ".git", "config"), "w") as f:
+                f.write('[remote "origin"]\n\turl = git@gitlab.com:me/repo.git\n')
+            with patch.dict(os.environ, {"GH_HOST": ""}):
+                self.assertFalse(GitChecker.has_open_prs(tmp))
+        mock_run.assert_not_called()
+
+    def test_has_github_remote_defers_unknown_hosts_to_gh(self):
+        """Test only remotes on known non-GitHub hosts skip gh."""
+        cases = {
+            "git@github.com:me/repo.git": True,
+            "git@github.mycorp.com:team/repo.git": True,
+            "https://git.corp.example:8443/team/repo": True,
+            "ssh://git@GitLab.com/me/repo.git": False,
+            "https://me@bitbucket.org/me/repo.git": False,
+            "/srv/mirrors/repo.git": False,
+        }
+        config_path = os.path.join(self.repo, ".git", "config")
+        with patch.dict(os.environ, {"GH_HOST": ""}):
+            for url, expected in cases.items():
+                with self.subTest(url=url):
+                    with open(config_path, "w") as f:
+                        f.write(f'[remote "origin"]\n\turl = {url}\n')
+                    self.assertEqual(GitChecker.has_github_remote(self.repo), expected)
+
+    def test_remote_urls_reads_only_remotes_origin_first(self):
+        """Test submodule and lfs URLs are ignored and origin leads the list."""
+        with open(os.path.join(self.repo, ".git", "config"), "w") as f:
+            f.write('[remote "upstream"]\n\turl = git@gitlab.com:up/repo.git\n'
+                    '[submodule "vendor/lib"]\n\turl = https://git.corp.example/lib.git\n'
+                    '[lfs]\n\turl = https://lfs.corp.example/repo\n'
+                    '[remote "origin"]\n\turl = git@bitbucket.org:me/repo.git\n')
+        self.assertEqual(_remote_urls(os.path.join(self.repo, ".git")),
+                         ["git@bitbucket.org:me/repo.git", "git@gitlab.com:up/repo.git"])
+        with patch.dict(os.environ, {"GH_HOST": ""}):
+            self.assertFalse(GitChecker.has_github_remote(self.repo))
+
+
+class TestDiskCache(unittest.TestCase):
+    """Test the cross-process JSON cache."""
+    
+    def test_round_trip_and_expiry(self):
+        """Test values are returned while fresh and dropped once stale."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskCache(tmpdir)
+            self.assertIsNone(cache.get("key", 60))
+            cache.set("key", True)
+            self.assertIs(cache.get("key", 60), True)
+            path = cache._path("key")
+            old = os.stat(path).st_mtime - 120
+            os.utime(path, (old, old))
+            self.assertIsNone(cache.get("key", 60))
+    
+    def test_get_swr_flags_stale_values(self):
+        """Test stale values are returned flagged until the hard TTL passes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskCache(tmpdir)
+            cache.set("key", True)
+            self.assertEqual(cache.get_swr("key", 60, 300), (True, False))
+            path = cache._path("key")
+            old = os.stat(path).st_mtime - 120
+            os.utime(path, (old, old))
+            self.assertEqual(cache.get_swr("key", 60, 300), (True, True))
+            self.assertEqual(cache.get_swr("key", 60, 100), (None, False))
+    
+    def test_claim_is_exclusive_until_expiry(self):
+        """Test a claim is granted once, then again only after it expires."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskCache(tmpdir)
+            self.assertTrue(cache.claim("key", 60))
+            self.assertFalse(cache.claim("key", 60))
+            self.assertTrue(cache.claim("other", 60))
+            path = cache._path("key")
+            old = os.stat(path).st_mtime - 120
+            os.utime(path, (old, old))
+            self.assertTrue(cache.claim("key", 60))
+            self.assertFalse(cache.claim("key", 60))
+    
+    def test_claim_granted_to_one_concurrent_caller(self):
+        """Test concurrent threads racing for one claim get a single grant."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskCache(tmpdir)
+            barrier = threading.Barrier(8)
+            results = []
+            
+            def race():
+                barrier.wait()
+                results.append(cache.claim("key", 60))
+            
+            threads = [threading.Thread(target=race) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(results.count(True), 1)
+
+
+class TestStartCacheWarm(unittest.TestCase):
+    """Test background cache-warm spawning."""
+    
+    def setUp(self):
+        """Use an isolated disk cache."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = patch('hook_core_optimized._disk_cache', DiskCache(self._tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    @patch('subprocess.Popen')
+    def test_one_warm_run_per_workspace(self, mock_popen):
+        """Test repeated requests for one workspace spawn once, other workspaces still spawn."""
+        start_cache_warm("/repo/a")
+        start_cache_warm("/repo/a")
+        start_cache_warm("/repo/b")
+        self.assertEqual([c.kwargs["cwd"] for c in mock_popen.call_args_list],
+                         ["/repo/a", "/repo/b"])
+
 
 class TestIntentAnalyzer(unittest.TestCase):
     """Test user intent analysis."""
     
+    def setUp(self):
+        """Use an isolated disk cache and an empty in-process cache."""
+        _cache.clear()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache_dir = self._tmp.name
+        patcher = patch('hook_core_optimized._disk_cache', DiskCache(self.cache_dir))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
     def test_get_intent_from_env(self):
         """Test intent override from environment."""
         with patch.dict(os.environ, {'AGENT_OS_INTENT': 'MAINTENANCE'}):
@@ -117,24 +356,80 @@ class TestIntentAnalyzer(unittest.TestCase):
         mock_run.side_effect = Exception("analyzer failed")
         result = IntentAnalyzer.get_intent("some text")
         self.assertEqual(result, "AMBIGUOUS")
+    
+    @patch('subprocess.run')
+    def test_get_intent_truncates_long_prompts(self, mock_run):
+        """Test only the opening of a long prompt is sent to the analyzer."""
+        mock_run.return_value.stdout = "NEW\n"
+        with patch.dict(os.environ, {'AGENT_OS_INTENT': ''}):
+            IntentAnalyzer.get_intent("implement feature " + "x" * 5000)
+        argv = mock_run.call_args[0][0]
+        self.assertEqual(len(argv[-1]), IntentAnalyzer.INTENT_TEXT_LIMIT)
+    
+    @patch('subprocess.run')
+    def test_get_intent_reuses_disk_cache(self, mock_run):
+        """Test a classified prompt is reused without rerunning the analyzer."""
+        mock_run.return_value.stdout = "MAINTENANCE\n"
+        with patch.dict(os.environ, {'AGENT_OS_INTENT': ''}):
+            self.assertEqual(IntentAnalyzer.get_intent("fix the login bug"), "MAINTENANCE")
+            _cache.clear()  # Simulate a new hook process
+            self.assertEqual(IntentAnalyzer.get_intent("fix the login bug"), "MAINTENANCE")
+        self.assertEqual(mock_run.call_count, 1)
+        for name in os.listdir(self.cache_dir):
+            with open(os.path.join(self.cache_dir, name)) as f:
+                self.assertNotIn("login", f.read())
+
+    @patch('subprocess.run')
+    def test_get_intent_cache_is_one_bounded_file(self, mock_run):
+        """Test recent intents share one file that keeps only the newest entries."""
+        mock_run.return_value.stdout = "NEW\n"
+        with patch.dict(os.environ, {'AGENT_OS_INTENT': ''}), \
+             patch.object(IntentAnalyzer, 'INTENT_CACHE_SIZE', 2):
+            for prompt in ("build a dashboard", "add a report", "create an api"):
+                IntentAnalyzer.get_intent(prompt)
+            self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+            _cache.clear()  # Simulate a new hook process
+            IntentAnalyzer.get_intent("create an api")
+            self.assertEqual(mock_run.call_count, 3)
+            IntentAnalyzer.get_intent("build a dashboard")
+            self.assertEqual(mock_run.call_count, 4)
 
 
 class TestSpecChecker(unittest.TestCase):
     """Test spec detection logic."""
     
+    def setUp(self):
+        """Start each test from an empty cache in a fresh project."""
+        _cache.clear()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.project = self._tmp.name
+    
     @patch('subprocess.run')
     def test_has_active_spec_true(self, mock_run):
         """Test detecting active specs."""
-        mock_run.return_value.stdout = "3\n"
-        result = SpecChecker.has_active_spec("/test/path")
+        os.makedirs(os.path.join(self.project, ".agent-os", "specs", "2025-01-01-feature"))
+        result = SpecChecker.has_active_spec(self.project)
         self.assertTrue(result)
+        mock_run.assert_not_called()
     
-    @patch('subprocess.run') 
-    def test_has_active_spec_false(self, mock_run):
+    def test_has_active_spec_false(self):
         """Test no active specs."""
-        mock_run.return_value.stdout = "0\n"
-        result = SpecChecker.has_active_spec("/test/path")
+        os.makedirs(os.path.join(self.project, ".agent-os", "specs"))
+        result = SpecChecker.has_active_spec(self.project)
         self.assertFalse(result)
+    
+    def test_has_active_spec_ignores_dotfiles(self):
+        """Test a specs directory holding only placeholder dotfiles has no spec."""
+        specs = os.path.join(self.project, ".agent-os", "specs")
+        os.makedirs(specs)
+        for name in (".gitkeep", ".DS_Store"):
+            open(os.path.join(specs, name), "w").close()
+        self.assertFalse(SpecChecker.has_active_spec(self.project))
+    
+    def test_has_active_spec_missing_directory(self):
+        """Test projects without a specs directory."""
+        self.assertFalse(SpecChecker.has_active_spec(self.project))
 
 
 class TestBaseHookHandler(unittest.TestCase):
@@ -163,6 +458,18 @@ class TestBaseHookHandler(unittest.TestCase):
         result = self.handler.check_work_session()
         self.assertTrue(result)
     
+    def test_check_workflow_status_memoized(self):
+        """Test workflow checks run once per handler instance."""
+        with patch.object(self.handler, 'check_work_session', return_value=False), \
+             patch.object(GitChecker, 'has_uncommitted_changes', return_value=True) as mock_git, \
+             patch.object(GitChecker, 'has_open_prs', return_value=False):
+            self.handler._workspace_root = "/test/path"
+            first = self.handler.check_workflow_status()
+            second = self.handler.check_workflow_status()
+        self.assertEqual(first, ["Uncommitted changes detected"])
+        self.assertEqual(first, second)
+        self.assertEqual(mock_git.call_count, 1)
+
     def test_handle_not_implemented(self):
         """Test that handle method must be implemented."""
         with self.assertRaises(NotImplementedError):
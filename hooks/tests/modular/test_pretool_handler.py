@@ -24,6 +24,8 @@ class TestBashCommandAnalyzer(unittest.TestCase):
         self.assertTrue(BashCommandAnalyzer.is_write_command("echo 'test' > file.txt"))
         self.assertTrue(BashCommandAnalyzer.is_write_command("sed -i 's/old/new/g' file.txt"))
         self.assertTrue(BashCommandAnalyzer.is_write_command("npm install"))
+        self.assertTrue(BashCommandAnalyzer.is_write_command("git apply fix.patch"))
+        self.assertTrue(BashCommandAnalyzer.is_write_command("rm\t-rf build"))
     
     def test_is_write_command_false(self):
         """Test non-write commands."""
@@ -31,6 +33,7 @@ class TestBashCommandAnalyzer(unittest.TestCase):
         self.assertFalse(BashCommandAnalyzer.is_write_command("cat file.txt"))
         self.assertFalse(BashCommandAnalyzer.is_write_command("grep pattern file"))
         self.assertFalse(BashCommandAnalyzer.is_write_command("echo hello"))
+        self.assertFalse(BashCommandAnalyzer.is_write_command("git status"))
     
     def test_is_readonly_command_true(self):
         """Test detecting read-only commands."""
@@ -82,6 +85,14 @@ class TestDocumentationChecker(unittest.TestCase):
         mock_run.assert_not_called()
 
 
+    def test_is_pr_command(self):
+        """Test PR command detection and its literal pre-check."""
+        self.assertTrue(DocumentationChecker.is_pr_command("gh pr create --fill"))
+        self.assertTrue(DocumentationChecker.is_pr_command("  gh  pr merge 12"))
+        self.assertFalse(DocumentationChecker.is_pr_command("gh pr list"))
+        self.assertFalse(DocumentationChecker.is_pr_command("ls -la"))
+
+
 class TestPreToolHandler(unittest.TestCase):
     """Test PreTool handler logic."""
     
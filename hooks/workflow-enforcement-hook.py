@@ -3,33 +3,50 @@
 Agent OS Workflow Enforcement Hook - Thin Dispatcher
 Delegates hook handling to optimized module handlers.
 Usage:
-  python3 workflow-enforcement-hook.py [pretool|pretool-task|userprompt|posttool]
+  python3 workflow-enforcement-hook.py [pretool|pretool-task|userprompt|posttool|warm]
 Reads JSON payload from stdin.
 """
 
-import json
+import importlib
 import os
 import sys
 
+# Optional faster JSON parser; the stdlib parser is the fallback
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Ensure modules package path is available when installed to ~/.agent-os/hooks
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 if CURRENT_DIR not in sys.path:
     sys.path.insert(0, CURRENT_DIR)
 
-try:
-    from modules import PreToolHandler, TaskHandler, UserPromptHandler, PostToolHandler  # type: ignore
-except Exception as e:
-    # Fail open to avoid blocking developer flows if hooks aren't fully installed yet
-    print(f"Agent OS hook import error: {e}", file=sys.stderr)
-    sys.exit(0)
-
+# Hook type -> (handler module, handler class). Handlers are imported on
+# demand, and only after the payload has been parsed.
 HANDLERS = {
-    "pretool": PreToolHandler,
-    "pretool-task": TaskHandler,
-    "userprompt": UserPromptHandler,
-    "posttool": PostToolHandler
+    "pretool": ("pretool_handler_optimized", "PreToolHandler"),
+    "pretool-task": ("task_handler_optimized", "TaskHandler"),
+    "userprompt": ("userprompt_handler_optimized", "UserPromptHandler"),
+    "posttool": ("posttool_handler_optimized", "PostToolHandler"),
+    # Internal: spawned detached by PostTool to refresh git/PR caches
+    "warm": ("warm_handler_optimized", "WarmHandler")
 }
 
+# Tools the PreTool handler inspects (Bash plus PreToolHandler.NEW_WORK_TOOLS;
+# test_final_hook checks the two stay equal). Any other tool is allowed
+# before the handler package is imported.
+PRETOOL_CHECKED_TOOLS = frozenset({"Bash", "Write", "Edit", "MultiEdit", "Update", "Task"})
+
+def load_handler(hook_type):
+    """Import and return the handler class for a hook type (None if unknown)."""
+    target = HANDLERS.get(hook_type)
+    if target is None:
+        return None
+    module_name, class_name = target
+    module = importlib.import_module(f"modules.{module_name}")
+    return getattr(module, class_name)
+
 def main():
     if len(sys.argv) < 2:
         # Unknown invocation; do not block developer flows
@@ -39,11 +56,24 @@ def main():
 
     # Parse JSON from stdin; fail open on parsing issues
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json_loads(sys.stdin.buffer.read())
     except Exception:
         sys.exit(0)
 
-    Handler = HANDLERS.get(hook_type)
+    # Fast path: PreTool allows unchecked tools without touching the handlers
+    if hook_type == "pretool" and isinstance(input_data, dict):
+        tool_name = input_data.get("tool_name")
+        # A non-string (possibly unhashable) name cannot be a checked tool
+        if not isinstance(tool_name, str) or tool_name not in PRETOOL_CHECKED_TOOLS:
+            sys.exit(0)
+
+    try:
+        Handler = load_handler(hook_type)
+    except Exception as e:
+        # Fail open to avoid blocking developer flows if hooks aren't fully installed yet
+        print(f"Agent OS hook import error: {e}", file=sys.stderr)
+        sys.exit(0)
+
     if Handler is None:
         # Unknown hook type; do not block
         sys.exit(0)